@@ -1,51 +1,187 @@
+import atexit
+import bisect
 import json
+import os
+import queue
+import stat
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional
+import tkinter as tk
 from tkinter import messagebox
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+
+def _dumps(obj) -> bytes:
+    # Compact on disk; export_pretty() writes an indented copy for reading
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(raw: bytes):
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
 
 class CredentialManager:
     """Handles storage and retrieval of SSH server credentials in a plain JSON file."""
 
-    def __init__(self, data_file: str = "servers.json"):
+    # Delay between the last change and the coalesced write when a Tk root is attached
+    SAVE_DELAY_MS = 300
+
+    def __init__(self, data_file: str = "servers.json", root: Optional[tk.Misc] = None):
         self.data_file = Path(data_file)
         self.servers: Dict[str, Dict] = {}
+        # Server names kept in sorted order as servers are added/removed
+        self._sorted_names: List[str] = []
+        # With a root, save_data only marks the store dirty and a debounced after() writes it
+        self._root = root
+        self._dirty = False
+        self._flush_after_id: Optional[str] = None
+        # With a root, serialized snapshots are written by a background thread
+        self._write_q: Optional[queue.Queue] = None
+        atexit.register(self.flush, True)
         self.load_data()
 
     def load_data(self):
         """Load server data from the JSON file."""
-        if not self.data_file.exists():
-            self.servers = {}
-            return
-
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                # Handle empty file case
-                content = f.read()
-                if not content:
-                    self.servers = {}
-                    return
-                self.servers = json.loads(content)
-        except (json.JSONDecodeError, IOError) as e:
+            try:
+                raw = self.data_file.read_bytes()
+            except FileNotFoundError:
+                raw = b''
+            # Missing or empty file: nothing to parse. Bytes let json detect and decode UTF-8 itself
+            self.servers = _loads(raw) if raw.strip() else {}
+        except (json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
             messagebox.showerror("Error", f"Failed to load server data from {self.data_file}: {e}")
             self.servers = {}
+        self._sorted_names = sorted(self.servers)
 
     def save_data(self):
-        """Save the current server data to the JSON file."""
+        """Save the current server data, coalescing bursts of changes when a Tk root is attached."""
+        self._dirty = True
+        if self._root is None:
+            self.flush()
+            return
+        if self._flush_after_id is not None:
+            try:
+                self._root.after_cancel(self._flush_after_id)
+            except Exception:
+                pass
+        try:
+            self._flush_after_id = self._root.after(self.SAVE_DELAY_MS, self.flush)
+        except Exception:
+            # Root already destroyed; write synchronously
+            self._flush_after_id = None
+            self.flush()
+
+    def flush(self, wait: bool = False):
+        """Write pending changes now, if there are any.
+
+        With a Tk root the write happens on the writer thread; `wait=True` blocks until it is on disk.
+        """
+        if self._flush_after_id is not None:
+            try:
+                self._root.after_cancel(self._flush_after_id)
+            except Exception:
+                pass
+            self._flush_after_id = None
+        if self._dirty:
+            self._dirty = False
+            self._write_now()
+        if wait and self._write_q is not None:
+            self._write_q.join()
+
+    def _write_now(self):
+        # Serialize in one go and write once; json.dump to a file issues a write per token.
+        # Dumping here also snapshots `servers` before the UI mutates it again.
+        payload = _dumps(self.servers)
+        if self._root is None:
+            try:
+                self._write_payload(payload)
+            except IOError as e:
+                messagebox.showerror("Error", f"Failed to save server data to {self.data_file}: {e}")
+            return
+        if self._write_q is None:
+            self._write_q = queue.Queue()
+            threading.Thread(target=self._writer_loop, name='servers-json-writer', daemon=True).start()
+        self._write_q.put(payload)
+
+    def _writer_loop(self):
+        q = self._write_q
+        while True:
+            payload = q.get()
+            taken = 1
+            # Only the newest snapshot matters
+            while True:
+                try:
+                    payload = q.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+            try:
+                self._write_payload(payload)
+            except IOError as e:
+                msg = f"Failed to save server data to {self.data_file}: {e}"
+                try:
+                    self._root.after(0, lambda: messagebox.showerror("Error", msg))
+                except Exception:
+                    pass
+            finally:
+                for _ in range(taken):
+                    q.task_done()
+
+    def _write_payload(self, payload: bytes):
+        # Write a sibling temp file and rename it over the original, so a crash or
+        # full disk mid-write can't leave a truncated servers.json behind
+        tmp = self.data_file.with_name(self.data_file.name + '.tmp')
+        try:
+            mode = stat.S_IMODE(os.stat(self.data_file).st_mode)
+        except FileNotFoundError:
+            mode = 0o600  # holds passwords
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
         try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.servers, f, indent=4)
-        except IOError as e:
-            messagebox.showerror("Error", f"Failed to save server data to {self.data_file}: {e}")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp, mode)
+            os.replace(tmp, self.data_file)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def export_pretty(self, path: str):
+        """Write an indented copy of the server data to `path` (created 0600; it holds passwords)."""
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(json.dumps(self.servers, indent=4).encode('utf-8'))
 
     def add_server(self, name: str, host: str, username: str, password: str, port: int = 22):
-        """Add or update a server in the store."""
-        self.servers[name] = {
+        """Add or update a server in the store.
+
+        Extra per-server settings already stored under `name` (favorite services,
+        `keepalive_interval`, `compress`) are kept.
+        """
+        entry = self.servers.get(name)
+        if entry is None:
+            bisect.insort(self._sorted_names, name)
+            entry = {}
+        entry.update({
             'host': host,
             'username': username,
             'password': password,
             'port': port
-        }
+        })
+        self.servers[name] = entry
         self.save_data()
 
     def get_server(self, name: str) -> Optional[Dict]:
@@ -56,11 +192,26 @@ class CredentialManager:
         """Delete a server from the store."""
         if name in self.servers:
             del self.servers[name]
+            del self._sorted_names[bisect.bisect_left(self._sorted_names, name)]
             self.save_data()
 
+    def rename_server(self, old_name: str, new_name: str):
+        """Move a server's whole entry, extra settings included, to a new name.
+
+        An existing entry under `new_name` is replaced.
+        """
+        if old_name not in self.servers or old_name == new_name:
+            return
+        entry = self.servers.pop(old_name)
+        del self._sorted_names[bisect.bisect_left(self._sorted_names, old_name)]
+        if new_name not in self.servers:
+            bisect.insort(self._sorted_names, new_name)
+        self.servers[new_name] = entry
+        self.save_data()
+
     def list_servers(self) -> List[str]:
         """Get a sorted list of all server names."""
-        return sorted(list(self.servers.keys()))
+        return list(self._sorted_names)
 
     # ----- Favorite services persistence -----
     def get_services(self, name: str) -> List[str]:
@@ -68,25 +219,15 @@ class CredentialManager:
         svcs = data.get('services')
         if isinstance(svcs, list):
             # keep only strings, unique preserve order
-            seen = set()
-            out = []
-            for s in svcs:
-                if isinstance(s, str) and s not in seen:
-                    seen.add(s)
-                    out.append(s)
-            return out
+            return list(dict.fromkeys(s for s in svcs if isinstance(s, str) and s))
         return []
 
     def set_services(self, name: str, services: List[str]):
         if name not in self.servers:
             return
-        # normalize list
-        norm = []
-        seen = set()
-        for s in services:
-            s = str(s).strip()
-            if s and s not in seen:
-                seen.add(s)
-                norm.append(s)
+        # normalize list: strip, drop empties, unique preserve order
+        norm = list(dict.fromkeys(s for s in (str(s).strip() for s in services) if s))
+        if self.servers[name].get('services') == norm:
+            return  # nothing changed; skip the rewrite
         self.servers[name]['services'] = norm
         self.save_data()
@@ -4,6 +4,13 @@ from tkinter import ttk, messagebox
 
 from utils import center_window, bring_window_to_front
 
+# Checkbox key -> permission bit, in user/group/other, r/w/x order
+_PERM_BITS = (
+    ('ur', stat.S_IRUSR), ('uw', stat.S_IWUSR), ('ux', stat.S_IXUSR),
+    ('gr', stat.S_IRGRP), ('gw', stat.S_IWGRP), ('gx', stat.S_IXGRP),
+    ('or', stat.S_IROTH), ('ow', stat.S_IWOTH), ('ox', stat.S_IXOTH),
+)
+
 
 class ServerDialog:
     """Dialog for adding/editing server information."""
@@ -15,11 +22,8 @@ class ServerDialog:
         self.dialog.title(title)
         self.dialog.resizable(False, False)
         self.dialog.transient(parent)
-        self.dialog.grab_set()
-        try:
-            bring_window_to_front(self.dialog)
-        except Exception:
-            pass
+        # Stay unmapped until built and centered so the window manager places it once
+        self.dialog.withdraw()
 
         self.setup_dialog_ui(server_data, server_name)
         # Center after layout relative to parent
@@ -27,6 +31,8 @@ class ServerDialog:
             center_window(self.dialog, parent)
         except Exception:
             pass
+        self.dialog.deiconify()
+        self.dialog.grab_set()
         try:
             bring_window_to_front(self.dialog)
         except Exception:
@@ -106,36 +112,26 @@ class PermissionsDialog:
         self.dialog.title("Change Permissions")
         self.dialog.resizable(False, False)
         self.dialog.transient(parent)
-        self.dialog.grab_set()
-        try:
-            bring_window_to_front(self.dialog)
-        except Exception:
-            pass
+        # Stay unmapped until built and centered so the window manager places it once
+        self.dialog.withdraw()
 
         frm = ttk.Frame(self.dialog, padding=10)
         frm.grid(row=0, column=0, sticky='nsew')
 
-        self.vars = {
-            'ur': tk.BooleanVar(value=bool(current_mode & stat.S_IRUSR)),
-            'uw': tk.BooleanVar(value=bool(current_mode & stat.S_IWUSR)),
-            'ux': tk.BooleanVar(value=bool(current_mode & stat.S_IXUSR)),
-            'gr': tk.BooleanVar(value=bool(current_mode & stat.S_IRGRP)),
-            'gw': tk.BooleanVar(value=bool(current_mode & stat.S_IWGRP)),
-            'gx': tk.BooleanVar(value=bool(current_mode & stat.S_IXGRP)),
-            'or': tk.BooleanVar(value=bool(current_mode & stat.S_IROTH)),
-            'ow': tk.BooleanVar(value=bool(current_mode & stat.S_IWOTH)),
-            'ox': tk.BooleanVar(value=bool(current_mode & stat.S_IXOTH)),
-        }
-
-        def row(y, label, r, w, x):
+        # Each checkbox's variable holds its own bit when checked, so the mode is their sum
+        bits = dict(_PERM_BITS)
+        self.vars = {key: tk.IntVar(value=current_mode & bit) for key, bit in _PERM_BITS}
+
+        def row(y, label, prefix):
             ttk.Label(frm, text=label).grid(row=y, column=0, sticky='w', padx=(0, 8))
-            ttk.Checkbutton(frm, text='r', variable=self.vars[r]).grid(row=y, column=1)
-            ttk.Checkbutton(frm, text='w', variable=self.vars[w]).grid(row=y, column=2)
-            ttk.Checkbutton(frm, text='x', variable=self.vars[x]).grid(row=y, column=3)
+            for col, letter in enumerate('rwx', start=1):
+                key = prefix + letter
+                ttk.Checkbutton(frm, text=letter, variable=self.vars[key],
+                                onvalue=bits[key], offvalue=0).grid(row=y, column=col)
 
-        row(0, 'User', 'ur', 'uw', 'ux')
-        row(1, 'Group', 'gr', 'gw', 'gx')
-        row(2, 'Other', 'or', 'ow', 'ox')
+        row(0, 'User', 'u')
+        row(1, 'Group', 'g')
+        row(2, 'Other', 'o')
 
         btns = ttk.Frame(frm)
         btns.grid(row=3, column=0, columnspan=4, pady=(10, 0))
@@ -145,6 +141,8 @@ class PermissionsDialog:
             center_window(self.dialog, parent)
         except Exception:
             pass
+        self.dialog.deiconify()
+        self.dialog.grab_set()
         try:
             bring_window_to_front(self.dialog)
         except Exception:
@@ -152,26 +150,7 @@ class PermissionsDialog:
         self.dialog.wait_window()
 
     def ok(self):
-        mode = 0
-        if self.vars['ur'].get():
-            mode |= stat.S_IRUSR
-        if self.vars['uw'].get():
-            mode |= stat.S_IWUSR
-        if self.vars['ux'].get():
-            mode |= stat.S_IXUSR
-        if self.vars['gr'].get():
-            mode |= stat.S_IRGRP
-        if self.vars['gw'].get():
-            mode |= stat.S_IWGRP
-        if self.vars['gx'].get():
-            mode |= stat.S_IXGRP
-        if self.vars['or'].get():
-            mode |= stat.S_IROTH
-        if self.vars['ow'].get():
-            mode |= stat.S_IWOTH
-        if self.vars['ox'].get():
-            mode |= stat.S_IXOTH
-        self.result = mode
+        self.result = sum(var.get() for var in self.vars.values())
         self.dialog.destroy()
 
     def cancel(self):
@@ -187,11 +166,8 @@ class OwnerGroupDialog:
         self.dialog.title("Change Owner/Group")
         self.dialog.resizable(False, False)
         self.dialog.transient(parent)
-        self.dialog.grab_set()
-        try:
-            bring_window_to_front(self.dialog)
-        except Exception:
-            pass
+        # Stay unmapped until built and centered so the window manager places it once
+        self.dialog.withdraw()
 
         frm = ttk.Frame(self.dialog, padding=10)
         frm.grid(row=0, column=0, sticky='nsew')
@@ -213,6 +189,8 @@ class OwnerGroupDialog:
             center_window(self.dialog, parent)
         except Exception:
             pass
+        self.dialog.deiconify()
+        self.dialog.grab_set()
         try:
             bring_window_to_front(self.dialog)
         except Exception:
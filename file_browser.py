@@ -1,16 +1,117 @@
+import codecs
+import functools
+import os
 import posixpath
+import shlex
 import stat
-import threading
 import time
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 
-import paramiko
-
 from dialogs import PermissionsDialog, OwnerGroupDialog
+from ssh_connection import IO_POOL, RemoteExecutor, SFTPPool
+
+if TYPE_CHECKING:
+    import paramiko
+
+# SFTP tuning: a large channel window lets many 32 KiB requests be in flight
+# on high-latency links; local file I/O is done in 1 MiB blocks.
+_SFTP_WINDOW_SIZE = 1 << 27
+_SFTP_MAX_PACKET_SIZE = 32768
+_TRANSFER_CHUNK_SIZE = 1 << 20
+# Read-ahead requests kept in flight per file (OpenSSH's sftp default is 64)
+_SFTP_MAX_REQUESTS = 64
+# Characters inserted into the editor per idle callback when loading a file
+_EDITOR_LOAD_CHUNK = 64 * 1024
+# Rows inserted into the file tree at a time; the rest follow as the view nears the bottom
+_LISTING_PAGE_ROWS = 500
+# Seconds a directory listing is reused when navigating back to it
+_DIR_CACHE_TTL = 5.0
+# 'rwxr-xr-x'-style strings for every value of the low 9 permission bits
+_PERM_STRINGS = [
+    ''.join('rwx'[i % 3] if (n >> (8 - i)) & 1 else '-' for i in range(9))
+    for n in range(512)
+]
+# Leading type character keyed by the S_IFMT bits; anything else shows as '-'
+_FTYPE_CHARS = {stat.S_IFDIR: 'd', stat.S_IFLNK: 'l'}
+# Full st_mode -> 'drwxr-xr-x' string; a listing only has a handful of distinct modes
+_MODE_STRINGS: Dict[int, str] = {}
+# GNU find record for the shell listing fast path: type, octal mode, uid, gid,
+# user, group, size, mtime, name; NUL-terminated so any file name is safe
+_FIND_LISTING_FORMAT = r'%y\t%m\t%U\t%G\t%u\t%g\t%s\t%T@\t%P\0'
+# find %y type letter -> S_IFMT bits
+_FIND_TYPE_BITS = {
+    'f': stat.S_IFREG, 'd': stat.S_IFDIR, 'l': stat.S_IFLNK, 'b': stat.S_IFBLK,
+    'c': stat.S_IFCHR, 'p': stat.S_IFIFO, 's': stat.S_IFSOCK,
+}
+
+
+class _IdNames:
+    """uid/gid -> name lookups for one server, plus the reverse maps used by owner/group edits."""
+
+    def __init__(self):
+        self.uid_names: Dict[int, str] = {}
+        self.gid_names: Dict[int, str] = {}
+        self.uids_by_name: Dict[str, int] = {}
+        self.gids_by_name: Dict[str, int] = {}
+        # Set once /etc/passwd and /etc/group have been read over SFTP on the current connection
+        self.files_read = False
+
+    def remember_uid(self, uid: int, name: str):
+        """Record a resolved user name in both lookup directions."""
+        if not name or name.isdigit():
+            return
+        self.uid_names[uid] = name
+        self.uids_by_name[name] = uid
+
+    def remember_gid(self, gid: int, name: str):
+        """Record a resolved group name in both lookup directions."""
+        if not name or name.isdigit():
+            return
+        self.gid_names[gid] = name
+        self.gids_by_name[name] = gid
+
+    def for_new_connection(self) -> '_IdNames':
+        """A fresh instance seeded with the names resolved so far, for the next connection.
+
+        Listing workers from the previous connection may still be writing to this one,
+        so it is only copied (a dict() copy is a single step under the GIL), never changed.
+        Ids that did not resolve are left out so they are retried once per connection.
+        """
+        fresh = _IdNames()
+        fresh.uid_names = {n: name for n, name in dict(self.uid_names).items() if name != str(n)}
+        fresh.gid_names = {n: name for n, name in dict(self.gid_names).items() if name != str(n)}
+        fresh.uids_by_name = dict(self.uids_by_name)
+        fresh.gids_by_name = dict(self.gids_by_name)
+        return fresh
+
+
+# (peer address, port) -> id names, kept across reconnects to the same server for the life of the process
+_ID_CACHES: Dict[tuple, _IdNames] = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _remote_path(base: str, name: str = '') -> str:
+    """Normalized remote path of `name` under `base` ('/' when both are empty).
+
+    Memoized: browsing keeps revisiting the same directories and their entries.
+    """
+    if not base and not name:
+        return '/'
+    return posixpath.normpath(posixpath.join(base, name))
+
+
+def _prefetch(f, size: int):
+    """Start pipelined read-ahead on an SFTP file, bounding the requests in flight."""
+    try:
+        f.prefetch(size, max_concurrent_requests=_SFTP_MAX_REQUESTS)
+    except TypeError:
+        # paramiko < 3.3 has no limit and queues every block at once
+        f.prefetch(size)
 
 
 class RemoteFileBrowserFrame(ttk.Frame):
@@ -18,12 +119,41 @@ class RemoteFileBrowserFrame(ttk.Frame):
 
     def __init__(self, parent):
         super().__init__(parent)
-        self.ssh_client: Optional[paramiko.SSHClient] = None
+        self.ssh_client: Optional['paramiko.SSHClient'] = None
+        self.executor: Optional[RemoteExecutor] = None
         self.sftp_client = None
+        # SFTP sessions lent to background work (listings, open/save, transfers). paramiko's
+        # SFTPClient is not safe for concurrent requests, so workers never touch sftp_client,
+        # which is used only from the Tk thread
+        self._sftp_pool: Optional[SFTPPool] = None
+        # path -> (monotonic time fetched, listdir_attr result)
+        self._dir_cache: Dict[str, Tuple[float, List]] = {}
+        # Tree row id -> SFTPAttributes from the listing that produced the row
+        self._attr_by_iid: Dict[str, object] = {}
+        # Incremented per list_directory call; stale background results are dropped
+        self._list_seq = 0
+        # Cleared once the remote lacks GNU find, so listings go straight to SFTP
+        self._shell_listing_ok = True
+        # Owner/group names for the attached server; listing workers get the instance
+        # current when they were submitted, never whatever is attached when they run
+        self._ids = _IdNames()
+        # Listing rows not yet inserted into the tree, and the pending idle call that appends the next page
+        self._pending_rows: List[tuple] = []
+        self._page_after_id: Optional[str] = None
         self.current_path = tk.StringVar(value="Not connected")
+        # Set while an upload or download runs; one transfer at a time
+        self._transfer_in_progress = False
         # Editor state
         self.open_file_path: Optional[str] = None
         self._editor_dirty: bool = False
+        # Bumped per file load so an in-progress chunked insert can be abandoned
+        self._editor_load_seq = 0
+        self._editor_loading = False
+        # Active search term; only matches inside the visible lines are tagged
+        self._highlight_pattern = ''
+        self._highlight_after_id: Optional[str] = None
+        # Pending after() id for highlighting while the search term is typed
+        self._search_after_id: Optional[str] = None
 
         self._build_ui()
 
@@ -68,11 +198,12 @@ class RemoteFileBrowserFrame(ttk.Frame):
         self.tree.column("perms", width=110, anchor='w')
         self.tree.column("#0", width=300, anchor='w')
         self.tree.heading("#0", text="Name")
+        self.tree.tag_configure('directory', foreground='blue', font=('TkDefaultFont', 9, 'bold'))
 
-        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        self._tree_vscroll = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll)
         self.tree.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
+        self._tree_vscroll.grid(row=0, column=1, sticky="ns")
 
         self.tree.bind("<Double-1>", self.on_item_double_click)
         # Context menu (right-click)
@@ -102,6 +233,7 @@ class RemoteFileBrowserFrame(ttk.Frame):
         # Press Enter in the search box to trigger Find Next
         try:
             self.search_entry.bind('<Return>', lambda e: self.find_next())
+            self.search_entry.bind('<KeyRelease>', self._on_search_key)
         except Exception:
             pass
         self.find_next_button = ttk.Button(editor_right, text="Find Next", command=self.find_next, state='disabled')
@@ -123,7 +255,7 @@ class RemoteFileBrowserFrame(ttk.Frame):
         )
         self.editor_vscroll = ttk.Scrollbar(editor_frame, orient='vertical', command=self.editor_text.yview)
         self.editor_hscroll = ttk.Scrollbar(editor_frame, orient='horizontal', command=self.editor_text.xview)
-        self.editor_text.configure(yscrollcommand=self.editor_vscroll.set, xscrollcommand=self.editor_hscroll.set)
+        self.editor_text.configure(yscrollcommand=self._on_editor_yscroll, xscrollcommand=self.editor_hscroll.set)
         self.editor_text.grid(row=0, column=0, sticky='nsew')
         self.editor_vscroll.grid(row=0, column=1, sticky='ns')
         self.editor_hscroll.grid(row=1, column=0, sticky='ew')
@@ -131,6 +263,7 @@ class RemoteFileBrowserFrame(ttk.Frame):
         # Configure tags and bindings for editor
         self.editor_text.tag_configure('search_highlight', background='yellow', foreground='black')
         self.editor_text.bind('<<Modified>>', self._on_text_modified)
+        self.editor_text.bind('<Configure>', lambda e: self._schedule_highlight())
 
         self.status_var = tk.StringVar(value="Not connected")
         status_bar = ttk.Label(self, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
@@ -147,33 +280,55 @@ class RemoteFileBrowserFrame(ttk.Frame):
         if not enabled:
             self._set_editor_enabled(False)
 
-    def attach_client(self, ssh_client: Optional[paramiko.SSHClient]):
-        """Attach or detach an SSH client; refresh the view accordingly."""
-        # Close previous SFTP if any
-        if self.sftp_client:
-            try:
-                self.sftp_client.close()
-            except Exception:
-                pass
-            self.sftp_client = None
+    def attach_client(self, ssh_client: Optional['paramiko.SSHClient'], executor: Optional[RemoteExecutor] = None):
+        """Attach or detach an SSH client; refresh the view accordingly.
+
+        Remote commands go through `executor` (a persistent shell); one is created
+        for the client if not supplied.
+        """
+        self._dir_cache = {}
+        self._list_seq += 1
+        if self._editor_loading:
+            self._editor_load_seq += 1
+            self._abandon_editor_load()
+        self._shell_listing_ok = True
+        # Re-attaching the same live client keeps its SFTP sessions instead of reopening them
+        reuse = (ssh_client is not None and ssh_client is self.ssh_client
+                 and self.sftp_client is not None and not self.sftp_client.get_channel().closed)
+        if not reuse:
+            # Close previous SFTP if any
+            if self.sftp_client:
+                try:
+                    self.sftp_client.close()
+                except Exception:
+                    pass
+                self.sftp_client = None
+            if self._sftp_pool:
+                self._sftp_pool.close()
+                self._sftp_pool = None
 
         self.ssh_client = ssh_client
+        if ssh_client is not None and executor is None:
+            executor = RemoteExecutor(ssh_client)
+        self.executor = executor
 
         if self.ssh_client is None:
             self.current_path.set("Not connected")
             self.status_var.set("Not connected")
+            self._attr_by_iid.clear()
+            self._pending_rows = []
             self.tree.delete(*self.tree.get_children())
             self.set_enabled(False)
             self._transfer_in_progress = False
             return
 
         try:
-            self.sftp_client = self.ssh_client.open_sftp()
-            # Reset owner/group caches for the new connection
-            self._uid_cache: Dict[int, str] = {}
-            self._gid_cache: Dict[int, str] = {}
+            if not reuse:
+                self.sftp_client = self._open_sftp(self.ssh_client)
+                self._sftp_pool = SFTPPool(lambda client=self.ssh_client: self._open_sftp(client))
+                self._bind_id_caches(self.ssh_client)
             initial_path = self.sftp_client.normalize('.')
-            initial_path = posixpath.normpath(initial_path)
+            initial_path = _remote_path(initial_path)
             self.set_enabled(True)
             self.list_directory(initial_path)
         except Exception as e:
@@ -181,139 +336,380 @@ class RemoteFileBrowserFrame(ttk.Frame):
             messagebox.showerror("SFTP Error", f"Could not open SFTP session: {e}")
             self.set_enabled(False)
 
-    def list_directory(self, path: str):
-        if not self.sftp_client:
-            return
-        path = posixpath.normpath(path) if path else '/'
-        self.current_path.set(path)
-        self.tree.delete(*self.tree.get_children())
+    def _bind_id_caches(self, ssh_client):
+        """Use the owner/group names remembered for this server, or fresh ones."""
         try:
-            items = self.sftp_client.listdir_attr(path)
-            self.status_var.set(f"Listing {path}")
-            # Resolve owner/group for any unknown uids/gids
-            pending_uids = set()
-            pending_gids = set()
-            for attr in items:
-                uid = getattr(attr, 'st_uid', None)
-                gid = getattr(attr, 'st_gid', None)
-                if isinstance(uid, int) and uid not in getattr(self, '_uid_cache', {}):
-                    pending_uids.add(uid)
-                if isinstance(gid, int) and gid not in getattr(self, '_gid_cache', {}):
-                    pending_gids.add(gid)
-            if pending_uids or pending_gids:
+            key = tuple(ssh_client.get_transport().getpeername()[:2])
+        except Exception:
+            key = None
+        previous = _ID_CACHES.get(key) if key else None
+        ids = previous.for_new_connection() if previous is not None else _IdNames()
+        if key:
+            _ID_CACHES[key] = ids
+        self._ids = ids
+
+    def _open_sftp(self, ssh_client):
+        """Open an SFTP session with a widened channel window for faster transfers."""
+        import paramiko
+        transport = ssh_client.get_transport()
+        if transport is None:
+            return ssh_client.open_sftp()
+        return paramiko.SFTPClient.from_transport(
+            transport,
+            window_size=_SFTP_WINDOW_SIZE,
+            max_packet_size=_SFTP_MAX_PACKET_SIZE,
+        )
+
+    def _upload_file(self, local_path: str, remote_path: str,
+                     progress: Optional[Callable[[int, int], None]] = None):
+        """Copy a local file to the server with pipelined (non-acknowledged) writes.
+
+        `progress(bytes_sent, total)` is called from the transfer thread after each block.
+        """
+        with self._sftp_pool.borrow() as sftp:
+            with open(local_path, 'rb') as lf, sftp.open(remote_path, 'wb') as rf:
+                rf.set_pipelined(True)
+                total = os.fstat(lf.fileno()).st_size
+                sent = 0
+                # One reusable buffer: each write is copied into an SFTP packet before returning
+                buf = bytearray(_TRANSFER_CHUNK_SIZE)
+                view = memoryview(buf)
+                while True:
+                    n = lf.readinto(buf)
+                    if not n:
+                        break
+                    rf.write(view[:n])
+                    sent += n
+                    if progress:
+                        progress(sent, total)
+            # Same check as paramiko's put(confirm=True); pipelined errors surface on close
+            size = sftp.stat(remote_path).st_size
+            if size != sent:
+                raise IOError(f"size mismatch in upload: {size} != {sent}")
+
+    def _download_file(self, remote_path: str, local_path: str,
+                       progress: Optional[Callable[[int, int], None]] = None):
+        """Copy a remote file to disk, prefetching the whole file in parallel requests.
+
+        A failed download removes the partial local file, so a preallocated but
+        incomplete copy is never left looking like a finished one.
+        """
+        with self._sftp_pool.borrow() as sftp, sftp.open(remote_path, 'rb') as rf:
+            lf = open(local_path, 'wb')
+            try:
+                total = rf.stat().st_size
+                _prefetch(rf, total)
+                if total and hasattr(os, 'posix_fallocate'):
+                    # Reserve the whole file up front so the filesystem can lay it out contiguously
+                    try:
+                        os.posix_fallocate(lf.fileno(), 0, total)
+                    except OSError:
+                        pass
+                received = 0
+                while True:
+                    chunk = rf.read(_TRANSFER_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    lf.write(chunk)
+                    received += len(chunk)
+                    if progress:
+                        progress(received, total)
+                if received < total:
+                    # The remote file shrank mid-transfer; drop the reserved tail
+                    lf.truncate(received)
+                lf.close()
+            except BaseException:
+                lf.close()
                 try:
-                    self._resolve_ids(pending_uids, pending_gids)
-                except Exception:
-                    # Non-fatal; leave numeric if resolution failed
+                    os.remove(local_path)
+                except OSError:
                     pass
-            dirs, files = [], []
-            for attr in items:
-                is_dir = stat.S_ISDIR(attr.st_mode)
-                perms = self._perms_from_mode(attr.st_mode)
-                uid = getattr(attr, 'st_uid', None)
-                gid = getattr(attr, 'st_gid', None)
-                owner = self._uid_cache.get(uid, str(uid) if uid is not None else '?')
-                group = self._gid_cache.get(gid, str(gid) if gid is not None else '?')
-                # Format modification time if available
-                try:
-                    mtime = getattr(attr, 'st_mtime', None)
-                    date_str = time.strftime('%Y-%m-%d %H:%M', time.localtime(mtime)) if isinstance(mtime, (int, float)) else ''
-                except Exception:
-                    date_str = ''
-                entry = (attr.filename, attr.st_size, is_dir, date_str, owner, group, perms)
-                (dirs if is_dir else files).append(entry)
-            dirs.sort(key=lambda x: x[0].lower())
-            files.sort(key=lambda x: x[0].lower())
-            for name, size, is_dir, date_str, owner, group, perms in dirs + files:
-                values = (size, "Directory" if is_dir else "File", date_str, owner, group, perms)
-                tags = ('directory',) if is_dir else ()
-                self.tree.insert("", "end", text=name, values=values, tags=tags)
-            self.tree.tag_configure('directory', foreground='blue', font=('TkDefaultFont', 9, 'bold'))
-        except Exception as e:
-            self.status_var.set(f"Error: {e}")
-            messagebox.showerror("Error", f"Could not list directory '{path}':\n{e}")
+                raise
 
-    def _perms_from_mode(self, mode: int) -> str:
-        # File type
-        if stat.S_ISDIR(mode):
-            ftype = 'd'
-        elif stat.S_ISLNK(mode):
-            ftype = 'l'
-        else:
-            ftype = '-'
-        # Permissions rwx for user, group, other
-        perms = ''
-        for who, r, w, x in (
-            ('USR', stat.S_IRUSR, stat.S_IWUSR, stat.S_IXUSR),
-            ('GRP', stat.S_IRGRP, stat.S_IWGRP, stat.S_IXGRP),
-            ('OTH', stat.S_IROTH, stat.S_IWOTH, stat.S_IXOTH),
-        ):
-            perms += 'r' if (mode & r) else '-'
-            perms += 'w' if (mode & w) else '-'
-            perms += 'x' if (mode & x) else '-'
-        return ftype + perms
-
-    def _resolve_ids(self, uids: set, gids: set):
-        """Resolve numeric uids/gids to names on the remote system using getent or passwd/group files."""
-        if not self.ssh_client:
+    def _transfer_progress(self, verb: str, filename: str) -> Callable[[int, int], None]:
+        """Build a progress callback that posts at most ~4 status updates per second."""
+        last = [0.0]
+
+        def report(done: int, total: int):
+            now = time.monotonic()
+            if now - last[0] < 0.25 and done < total:
+                return
+            last[0] = now
+            pct = f" ({done * 100 // total}%)" if total else ''
+            msg = f"{verb} {filename}: {done // 1024:,} KiB{pct}"
+            try:
+                self.after(0, lambda: self.status_var.set(msg))
+            except Exception:
+                pass
+
+        return report
+
+    def list_directory(self, path: str):
+        """Fetch a directory listing in the background and show it when ready."""
+        if not self.sftp_client:
             return
-        # Initialize caches if missing
-        if not hasattr(self, '_uid_cache'):
-            self._uid_cache = {}
-        if not hasattr(self, '_gid_cache'):
-            self._gid_cache = {}
+        path = _remote_path(path)
+        # Only the most recent request may update the tree
+        self._list_seq += 1
+        seq = self._list_seq
+        # Everything the worker touches is bound now, so a server switch mid-listing
+        # cannot mix this server's results into the next one's caches
+        pool, executor, dir_cache, ids = self._sftp_pool, self.executor, self._dir_cache, self._ids
+        self.status_var.set(f"Loading {path}...")
+
+        def worker():
+            rows, err = None, None
+            try:
+                with pool.borrow() as sftp:
+                    rows = self._fetch_listing_rows(sftp, executor, dir_cache, ids, path)
+            except Exception as e:
+                err = e
+            try:
+                self.after(0, lambda: self._apply_listing(seq, path, rows, err))
+            except Exception:
+                pass
+
+        IO_POOL.submit(worker)
 
-        def run_cmd(cmd: str) -> str:
+    def _fetch_listing_rows(self, sftp, executor: Optional[RemoteExecutor], dir_cache: Dict,
+                            ids: _IdNames, path: str) -> List[tuple]:
+        """Worker side of list_directory: list, resolve owners and build sorted rows."""
+        cached = dir_cache.get(path)
+        if cached and time.monotonic() - cached[0] < _DIR_CACHE_TTL:
+            items = cached[1]
+        else:
+            items = self._listdir_via_shell(executor, ids, path)
+            if items is None:
+                items = sftp.listdir_attr(path)
+            dir_cache[path] = (time.monotonic(), items)
+        # Resolve owner/group for any unknown uids/gids
+        pending_uids = set()
+        pending_gids = set()
+        uid_cache = ids.uid_names
+        gid_cache = ids.gid_names
+        for attr in items:
+            uid = getattr(attr, 'st_uid', None)
+            gid = getattr(attr, 'st_gid', None)
+            if isinstance(uid, int) and uid not in uid_cache:
+                pending_uids.add(uid)
+            if isinstance(gid, int) and gid not in gid_cache:
+                pending_gids.add(gid)
+        if pending_uids or pending_gids:
             try:
-                stdin, stdout, stderr = self.ssh_client.exec_command(cmd, timeout=5)
-                out = stdout.read().decode('utf-8', errors='ignore')
-                return out
+                self._resolve_ids(executor, ids, pending_uids, pending_gids, sftp)
             except Exception:
-                return ''
+                # Non-fatal; leave numeric if resolution failed
+                pass
+        # Per-listing lookup tables covering every id seen, so the row loop is a plain index
+        owner_of = dict(uid_cache)
+        group_of = dict(gid_cache)
+        for uid in pending_uids:
+            owner_of.setdefault(uid, str(uid))
+        for gid in pending_gids:
+            group_of.setdefault(gid, str(gid))
+        owner_of[None] = group_of[None] = '?'
+        # (is_file, lowercase name, ...) so one sort puts directories first, then by name
+        entries = []
+        # Local aliases for the per-row loop
+        S_ISDIR = stat.S_ISDIR
+        mode_strings = _MODE_STRINGS
+        perms_from_mode = self._perms_from_mode
+        strftime, localtime = time.strftime, time.localtime
+        append = entries.append
+        for attr in items:
+            mode = attr.st_mode
+            is_dir = S_ISDIR(mode)
+            perms = mode_strings.get(mode)
+            if perms is None:
+                perms = perms_from_mode(mode)
+            owner = owner_of[getattr(attr, 'st_uid', None)]
+            group = group_of[getattr(attr, 'st_gid', None)]
+            # Format modification time if available
+            try:
+                mtime = getattr(attr, 'st_mtime', None)
+                date_str = strftime('%Y-%m-%d %H:%M', localtime(mtime)) if isinstance(mtime, (int, float)) else ''
+            except Exception:
+                date_str = ''
+            name = attr.filename
+            values = (attr.st_size, "Directory" if is_dir else "File", date_str, owner, group, perms)
+            tags = ('directory',) if is_dir else ()
+            append((not is_dir, name.lower(), name, values, tags, attr))
+        entries.sort(key=itemgetter(0, 1))
+        return [entry[2:] for entry in entries]
+
+    def _listdir_via_shell(self, executor: Optional[RemoteExecutor], ids: _IdNames, path: str) -> Optional[List]:
+        """List `path` with one `find -printf` call, owner names included.
+
+        SFTP READDIR needs several round trips on big directories and returns only
+        numeric ids. Returns None when the shell route is unusable (no executor,
+        no exec channel, non-GNU find, unreadable directory, names that are not
+        UTF-8) so the caller falls back to SFTP.
+        """
+        if not executor or not self._shell_listing_ok:
+            return None
+        import paramiko
+        cmd = f"find {shlex.quote(path)} -mindepth 1 -maxdepth 1 -printf '{_FIND_LISTING_FORMAT}'"
+        try:
+            # Strict: a replaced character would name a file that does not exist
+            out, err, status = executor.run(cmd, timeout=30, errors='strict')
+        except UnicodeDecodeError:
+            return None
+        except (paramiko.SSHException, EOFError):
+            # The account cannot run a shell (e.g. SFTP-only); stop trying on this connection
+            if executor is self.executor:
+                self._shell_listing_ok = False
+            return None
+        except Exception:
+            return None
+        if status != 0:
+            if '-printf' in err or '-mindepth' in err:
+                # BSD/busybox find; don't try again on this connection
+                if executor is self.executor:
+                    self._shell_listing_ok = False
+                return None
+            if not out:
+                return None
+            # Some entries could not be stat'ed (vanished or unreadable); the rest are
+            # complete records, so keep them instead of listing everything again over SFTP
+        items = []
+        try:
+            for record in out.split('\0'):
+                if not record:
+                    continue
+                ftype, mode, uid, gid, user, group, size, mtime, name = record.split('\t', 8)
+                attr = paramiko.SFTPAttributes()
+                attr.filename = name
+                attr.st_mode = _FIND_TYPE_BITS.get(ftype, 0) | int(mode, 8)
+                attr.st_uid = int(uid)
+                attr.st_gid = int(gid)
+                attr.st_size = int(size)
+                attr.st_mtime = int(float(mtime))
+                ids.remember_uid(attr.st_uid, user)
+                ids.remember_gid(attr.st_gid, group)
+                items.append(attr)
+        except ValueError:
+            if executor is self.executor:
+                self._shell_listing_ok = False
+            return None
+        return items
+
+    def _apply_listing(self, seq: int, path: str, rows: Optional[List[tuple]], err: Optional[Exception]):
+        """UI side of list_directory: replace the tree rows with a fetched listing."""
+        if seq != self._list_seq or not self.sftp_client:
+            return  # superseded by a newer listing or disconnected
+        if err is not None:
+            self.status_var.set(f"Error: {err}")
+            messagebox.showerror("Error", f"Could not list directory '{path}':\n{err}")
+            return
+        self.current_path.set(path)
+        self._attr_by_iid.clear()
+        self.tree.delete(*self.tree.get_children())
+        # Huge directories are inserted a page at a time as the user scrolls down
+        if self._page_after_id:
+            self.after_cancel(self._page_after_id)
+        self._pending_rows = rows
+        self._insert_listing_page()
+        self.status_var.set(f"Listing {path}")
+
+    def _insert_listing_page(self):
+        """Append the next page of pending listing rows to the tree."""
+        self._page_after_id = None
+        rows = self._pending_rows[:_LISTING_PAGE_ROWS]
+        self._pending_rows = self._pending_rows[_LISTING_PAGE_ROWS:]
+        # Rows are fully prebuilt by the worker; keep this loop to one Tcl call per row
+        insert = self.tree.insert
+        attr_by_iid = self._attr_by_iid
+        for name, values, tags, attr in rows:
+            attr_by_iid[insert("", "end", text=name, values=values, tags=tags)] = attr
+
+    def _on_tree_yscroll(self, first, last):
+        self._tree_vscroll.set(first, last)
+        if self._pending_rows and self._page_after_id is None and float(last) > 0.9:
+            self._page_after_id = self.after_idle(self._insert_listing_page)
+
+    def _invalidate_dir(self, path: str, include_parent: bool = False):
+        """Drop cached listings for `path` (and its parent, whose entry mtime changed)."""
+        path = _remote_path(path)
+        self._dir_cache.pop(path, None)
+        if include_parent:
+            self._dir_cache.pop(posixpath.dirname(path) or '/', None)
 
-        # Try getent for users
+    def _perms_from_mode(self, mode: int) -> str:
+        perms = _MODE_STRINGS.get(mode)
+        if perms is None:
+            perms = _MODE_STRINGS[mode] = _FTYPE_CHARS.get(stat.S_IFMT(mode), '-') + _PERM_STRINGS[mode & 0o777]
+        return perms
+
+    def _resolve_ids(self, executor: Optional[RemoteExecutor], ids: _IdNames,
+                     uids: set, gids: set, sftp=None):
+        """Resolve numeric uids/gids to names on the remote system using getent or passwd/group files."""
+        if not executor:
+            return
+        if sftp is not None and not ids.files_read:
+            # Once per connection, read the local account files over the open SFTP
+            # session; only ids they don't cover (LDAP, NIS, ...) need a getent call
+            ids.files_read = True
+            self._read_id_files(sftp, ids)
+            uids = {u for u in uids if u not in ids.uid_names}
+            gids = {g for g in gids if g not in ids.gid_names}
+
+        # One round trip: tagged getent sections, reading the flat files only where getent
+        # is missing (getent also exits non-zero when just some ids are unknown)
+        parts = []
         if uids:
-            # getent passwd 0 1000 1001 ...
             uid_list = ' '.join(str(u) for u in uids)
-            out = run_cmd(f"getent passwd {uid_list}")
-            for line in out.splitlines():
-                parts = line.split(':')
-                if len(parts) >= 3 and parts[2].isdigit():
-                    uid = int(parts[2])
-                    name = parts[0]
-                    self._uid_cache[uid] = name
-            # Fallback: parse /etc/passwd if needed
-            missing_uids = [u for u in uids if u not in self._uid_cache]
-            if missing_uids:
-                etc = run_cmd('cat /etc/passwd')
-                for line in etc.splitlines():
-                    parts = line.split(':')
-                    if len(parts) >= 3 and parts[2].isdigit():
-                        uid = int(parts[2])
-                        name = parts[0]
-                        if uid in missing_uids:
-                            self._uid_cache[uid] = name
-
-        # Try getent for groups
+            parts.append(f"echo __UIDS__; if command -v getent >/dev/null 2>&1; "
+                         f"then getent passwd {uid_list}; else cat /etc/passwd; fi 2>/dev/null")
         if gids:
             gid_list = ' '.join(str(g) for g in gids)
-            out = run_cmd(f"getent group {gid_list}")
-            for line in out.splitlines():
-                parts = line.split(':')
-                if len(parts) >= 3 and parts[2].isdigit():
-                    gid = int(parts[2])
-                    name = parts[0]
-                    self._gid_cache[gid] = name
-            missing_gids = [g for g in gids if g not in self._gid_cache]
-            if missing_gids:
-                etc = run_cmd('cat /etc/group')
-                for line in etc.splitlines():
-                    parts = line.split(':')
-                    if len(parts) >= 3 and parts[2].isdigit():
-                        gid = int(parts[2])
-                        name = parts[0]
-                        if gid in missing_gids:
-                            self._gid_cache[gid] = name
+            parts.append(f"echo __GIDS__; if command -v getent >/dev/null 2>&1; "
+                         f"then getent group {gid_list}; else cat /etc/group; fi 2>/dev/null")
+        if not parts:
+            return
+        try:
+            out, _, _ = executor.run('; '.join(parts), timeout=5)
+        except Exception:
+            # Leave ids unresolved so the next listing retries
+            return
+
+        remember = None
+        wanted = set()
+        for line in out.splitlines():
+            if line == '__UIDS__':
+                remember, wanted = ids.remember_uid, uids
+                continue
+            if line == '__GIDS__':
+                remember, wanted = ids.remember_gid, gids
+                continue
+            if remember is None:
+                continue
+            fields = line.split(':')
+            if len(fields) >= 3 and fields[2].isdigit():
+                num = int(fields[2])
+                if num in wanted:
+                    remember(num, fields[0])
+        # Remember misses as their numeric form so they are not queried again
+        for uid in uids:
+            ids.uid_names.setdefault(uid, str(uid))
+        for gid in gids:
+            ids.gid_names.setdefault(gid, str(gid))
+
+    def _read_id_files(self, sftp, ids: _IdNames):
+        """Cache every entry of the remote /etc/passwd and /etc/group, first entry per id winning."""
+        for path, remember in (('/etc/passwd', ids.remember_uid), ('/etc/group', ids.remember_gid)):
+            try:
+                with sftp.open(path, 'r') as f:
+                    data = f.read()
+            except (IOError, OSError):
+                continue
+            seen = set()
+            for line in data.decode('utf-8', errors='replace').splitlines():
+                fields = line.split(':')
+                if len(fields) >= 3 and fields[2].isdigit():
+                    num = int(fields[2])
+                    if num not in seen:
+                        seen.add(num)
+                        remember(num, fields[0])
 
     def on_item_double_click(self, event):
         item_id = self.tree.focus()
@@ -324,12 +720,12 @@ class RemoteFileBrowserFrame(ttk.Frame):
         item_type = values[1] if len(values) > 1 else None
         if item_type == "Directory":
             dir_name = item['text']
-            new_path = posixpath.normpath(posixpath.join(self.current_path.get(), dir_name))
+            new_path = _remote_path(self.current_path.get(), dir_name)
             self.list_directory(new_path)
         elif item_type == "File":
             filename = item['text']
-            remote_path = posixpath.normpath(posixpath.join(self.current_path.get(), filename))
-            self.open_remote_file(remote_path)
+            remote_path = _remote_path(self.current_path.get(), filename)
+            self.open_remote_file(remote_path, self._attr_by_iid.get(item_id))
 
     def on_right_click(self, event):
         # Select the row under the mouse and show the context menu
@@ -363,11 +759,9 @@ class RemoteFileBrowserFrame(ttk.Frame):
         values = item.get('values') or []
         item_type = values[1] if len(values) > 1 else None
         name = item['text']
-        remote_path = posixpath.normpath(posixpath.join(self.current_path.get(), name))
-        try:
-            attr = self.sftp_client.stat(remote_path) if self.sftp_client else None
-        except Exception:
-            attr = None
+        remote_path = _remote_path(self.current_path.get(), name)
+        # Attributes come from the listing; no extra stat round trip
+        attr = self._attr_by_iid.get(sel[0])
         return remote_path, item_type, attr
 
     def change_permissions_selected(self):
@@ -382,9 +776,13 @@ class RemoteFileBrowserFrame(ttk.Frame):
         new_perm_bits = dlg.result  # lower 9 bits
         # Preserve file type bits
         new_mode = (attr.st_mode & ~0o777) | (new_perm_bits & 0o777)
+        if self._apply_metadata(self.tree.selection()[0], remote_path, attr, mode=new_mode):
+            self.status_var.set(f"Permissions updated for {remote_path}")
+            return
         try:
             self.sftp_client.chmod(remote_path, new_mode)
             self.status_var.set(f"Permissions updated for {remote_path}")
+            self._invalidate_dir(self.current_path.get())
             self.list_directory(self.current_path.get())
         except Exception as e:
             messagebox.showerror("Change Permissions Failed", f"Could not change permissions:\n{e}")
@@ -398,8 +796,8 @@ class RemoteFileBrowserFrame(ttk.Frame):
         # Prefill with names if available from caches; else numeric
         uid = getattr(attr, 'st_uid', None)
         gid = getattr(attr, 'st_gid', None)
-        owner_name = self._uid_cache.get(uid, str(uid) if uid is not None else '') if hasattr(self, '_uid_cache') else (str(uid) if uid is not None else '')
-        group_name = self._gid_cache.get(gid, str(gid) if gid is not None else '') if hasattr(self, '_gid_cache') else (str(gid) if gid is not None else '')
+        owner_name = self._ids.uid_names.get(uid, str(uid) if uid is not None else '')
+        group_name = self._ids.gid_names.get(gid, str(gid) if gid is not None else '')
         dlg = OwnerGroupDialog(self, owner_name, group_name)
         if dlg.result is None:
             return
@@ -410,18 +808,83 @@ class RemoteFileBrowserFrame(ttk.Frame):
         if uid_val is None or gid_val is None:
             messagebox.showerror("Invalid Owner/Group", "Failed to resolve owner or group to numeric IDs.")
             return
+        iid = self.tree.selection()[0]
+        if self._apply_metadata(iid, remote_path, attr, owner=(uid_val, gid_val)):
+            self._ids.remember_uid(uid_val, new_owner)
+            self._ids.remember_gid(gid_val, new_group)
+            # Redraw with the names the user entered
+            self._refresh_row_metadata(iid, attr)
+            self.status_var.set(f"Owner/Group updated for {remote_path}")
+            return
         try:
             self.sftp_client.chown(remote_path, uid_val, gid_val)
             # Update caches
-            if hasattr(self, '_uid_cache'):
-                self._uid_cache[uid_val] = new_owner
-            if hasattr(self, '_gid_cache'):
-                self._gid_cache[gid_val] = new_group
+            self._ids.remember_uid(uid_val, new_owner)
+            self._ids.remember_gid(gid_val, new_group)
             self.status_var.set(f"Owner/Group updated for {remote_path}")
+            self._invalidate_dir(self.current_path.get())
             self.list_directory(self.current_path.get())
         except Exception as e:
             messagebox.showerror("Change Owner/Group Failed", f"Could not change owner/group:\n{e}")
 
+    def _apply_metadata(self, iid: str, remote_path: str, attr, mode: Optional[int] = None,
+                        owner: Optional[Tuple[int, int]] = None) -> bool:
+        """Change mode and/or owner:group and read back the result in one remote command.
+
+        On success `attr` (the listing's SFTPAttributes for row `iid`) and the row itself
+        are updated in place, so no re-listing is needed. Returns False if the shell
+        route failed for any reason (e.g. a non-POSIX remote without `stat -c`), in
+        which case the caller falls back to the SFTP calls.
+        """
+        if not self.executor:
+            return False
+        q = shlex.quote(remote_path)
+        parts = []
+        if mode is not None:
+            parts.append(f"chmod {mode & 0o7777:o} {q}")
+        if owner is not None:
+            parts.append(f"chown {int(owner[0])}:{int(owner[1])} {q}")
+        parts.append(f"stat -c '%f %u %g' {q}")
+        try:
+            out, _, status = self.executor.run(' && '.join(parts), timeout=10)
+            raw_mode, uid, gid = out.split()
+            if status != 0:
+                return False
+            attr.st_mode = int(raw_mode, 16)
+            attr.st_uid = int(uid)
+            attr.st_gid = int(gid)
+        except Exception:
+            return False
+        self._refresh_row_metadata(iid, attr)
+        return True
+
+    def _find_row(self, name: str) -> Optional[str]:
+        """Return the tree row id listing `name` in the current directory, if any."""
+        for iid, attr in self._attr_by_iid.items():
+            if getattr(attr, 'filename', None) == name:
+                return iid
+        return None
+
+    def _update_row_attrs(self, iid: str, attr):
+        """Redraw the size/date cells of row `iid` from `attr`, then its metadata cells."""
+        try:
+            mtime = getattr(attr, 'st_mtime', None)
+            date_str = time.strftime('%Y-%m-%d %H:%M', time.localtime(mtime)) if isinstance(mtime, (int, float)) else ''
+            self.tree.set(iid, 'size', attr.st_size)
+            self.tree.set(iid, 'date', date_str)
+        except Exception:
+            pass
+        self._refresh_row_metadata(iid, attr)
+
+    def _refresh_row_metadata(self, iid: str, attr):
+        """Redraw the permissions/owner/group cells of row `iid` from `attr`."""
+        try:
+            self.tree.set(iid, 'perms', self._perms_from_mode(attr.st_mode))
+            self.tree.set(iid, 'owner', self._ids.uid_names.get(attr.st_uid, str(attr.st_uid)))
+            self.tree.set(iid, 'group', self._ids.gid_names.get(attr.st_gid, str(attr.st_gid)))
+        except Exception:
+            pass
+
     def delete_selected(self):
         if not self.sftp_client:
             return
@@ -437,6 +900,7 @@ class RemoteFileBrowserFrame(ttk.Frame):
         try:
             self.sftp_client.remove(remote_path)
             self.status_var.set(f"Deleted {name}")
+            self._invalidate_dir(self.current_path.get(), include_parent=True)
             self.list_directory(self.current_path.get())
         except Exception as e:
             messagebox.showerror("Delete Failed", f"Could not delete file:\n{e}")
@@ -447,25 +911,24 @@ class RemoteFileBrowserFrame(ttk.Frame):
         name = str(name).strip()
         if name.isdigit():
             return int(name)
+        if name in self._ids.uids_by_name:
+            return self._ids.uids_by_name[name]
         try:
-            stdin, stdout, stderr = self.ssh_client.exec_command(f"id -u {name}", timeout=5)
-            out = stdout.read().decode('utf-8', errors='ignore').strip()
+            out, _, _ = self.executor.run(f"id -u {shlex.quote(name)}", timeout=5)
+            out = out.strip()
             if out.isdigit():
                 uid = int(out)
-                if hasattr(self, '_uid_cache'):
-                    self._uid_cache[uid] = name
+                self._ids.remember_uid(uid, name)
                 return uid
         except Exception:
             pass
         try:
-            stdin, stdout, stderr = self.ssh_client.exec_command(f"getent passwd {name}", timeout=5)
-            out = stdout.read().decode('utf-8', errors='ignore')
+            out, _, _ = self.executor.run(f"getent passwd {shlex.quote(name)}", timeout=5)
             for line in out.splitlines():
                 parts = line.split(':')
                 if len(parts) >= 3 and parts[0] == name and parts[2].isdigit():
                     uid = int(parts[2])
-                    if hasattr(self, '_uid_cache'):
-                        self._uid_cache[uid] = name
+                    self._ids.remember_uid(uid, name)
                     return uid
         except Exception:
             pass
@@ -477,30 +940,26 @@ class RemoteFileBrowserFrame(ttk.Frame):
         name = str(name).strip()
         if name.isdigit():
             return int(name)
+        if name in self._ids.gids_by_name:
+            return self._ids.gids_by_name[name]
         try:
-            stdin, stdout, stderr = self.ssh_client.exec_command(f"getent group {name}", timeout=5)
-            out = stdout.read().decode('utf-8', errors='ignore')
+            out, _, _ = self.executor.run(f"getent group {shlex.quote(name)}", timeout=5)
             for line in out.splitlines():
                 parts = line.split(':')
                 if len(parts) >= 3 and parts[0] == name and parts[2].isdigit():
                     gid = int(parts[2])
-                    if hasattr(self, '_gid_cache'):
-                        self._gid_cache[gid] = name
+                    self._ids.remember_gid(gid, name)
                     return gid
         except Exception:
             pass
         return None
 
     def go_up_directory(self):
-        current = self.current_path.get() or '/'
-        norm_current = posixpath.normpath(current)
+        norm_current = _remote_path(self.current_path.get())
         if norm_current == '/':
             self.list_directory('/')
             return
-        parent_path = posixpath.dirname(norm_current)
-        if not parent_path:
-            parent_path = '/'
-        self.list_directory(parent_path)
+        self.list_directory(_remote_path(posixpath.dirname(norm_current)))
 
     def _get_active_or_selected_dir(self) -> Optional[str]:
         """Return the target remote directory: selected directory if any, else current path."""
@@ -514,7 +973,7 @@ class RemoteFileBrowserFrame(ttk.Frame):
             item_type = values[1] if len(values) > 1 else None
             if item_type == 'Directory':
                 dir_name = item['text']
-                return posixpath.normpath(posixpath.join(base, dir_name))
+                return _remote_path(base, dir_name)
         return base
 
     def prompt_and_upload(self):
@@ -523,7 +982,7 @@ class RemoteFileBrowserFrame(ttk.Frame):
             messagebox.showwarning("Not Connected", "Please connect to a server first.")
             return
 
-        if getattr(self, '_transfer_in_progress', False):
+        if self._transfer_in_progress:
             self.status_var.set("Another transfer is in progress. Please wait...")
             return
 
@@ -538,44 +997,59 @@ class RemoteFileBrowserFrame(ttk.Frame):
             return
 
         filename = Path(local_path).name
-        remote_path = posixpath.join(remote_dir, filename)
+        remote_path = _remote_path(remote_dir, filename)
 
-        # Existence and overwrite checks
-        def _stat(path):
+        # Existence check runs on the pool; the overwrite prompt follows on the Tk thread
+        self._transfer_in_progress = True
+        self.status_var.set(f"Checking {remote_path}...")
+        pool = self._sftp_pool
+
+        def _stat():
             try:
-                return self.sftp_client.stat(path)
+                with pool.borrow() as sftp:
+                    return sftp.stat(remote_path)
             except Exception:
                 return None
 
-        existing = _stat(remote_path)
+        IO_POOL.submit(_stat).add_done_callback(
+            lambda fut: self.after(0, self._confirm_upload, pool, local_path, remote_dir, filename, fut.result()))
+
+    def _confirm_upload(self, pool: SFTPPool, local_path: str, remote_dir: str, filename: str, existing):
+        if self._sftp_pool is not pool:
+            # Disconnected (or switched servers) while the check was in flight
+            self._transfer_in_progress = False
+            return
+        remote_path = _remote_path(remote_dir, filename)
         if existing is not None:
             # If a directory exists with same name, block
             if stat.S_ISDIR(existing.st_mode):
+                self._transfer_in_progress = False
+                self.status_var.set(f"Listing {self.current_path.get()}")
                 messagebox.showerror("Upload Error", f"A directory named '{filename}' already exists at the destination.")
                 return
             # Confirm overwrite
             if not messagebox.askyesno("Overwrite?", f"'{filename}' already exists. Overwrite?"):
+                self._transfer_in_progress = False
+                self.status_var.set(f"Listing {self.current_path.get()}")
                 return
 
         # Run upload in background to keep UI responsive
-        self._transfer_in_progress = True
         self.status_var.set(f"Uploading {filename} to {remote_dir}...")
         self.set_enabled(False)
 
-        def _do_upload():
-            err = None
+        self._run_in_background(
+            lambda: self._upload_file(local_path, remote_path, self._transfer_progress("Uploading", filename)),
+            lambda err: self._after_upload(remote_dir, filename, err))
+
+    def _run_in_background(self, func: Callable[[], None], on_done: Callable[[Optional[BaseException]], None]):
+        """Run func on the shared I/O pool, then call on_done(error or None) on the Tk thread."""
+        def _done(fut):
             try:
-                self.sftp_client.put(local_path, remote_path)
-            except Exception as e:
-                err = e
-            finally:
-                # Back to UI thread
-                try:
-                    self.after(0, lambda: self._after_upload(remote_dir, filename, err))
-                except Exception:
-                    pass
+                self.after(0, on_done, fut.exception())
+            except Exception:
+                pass
 
-        threading.Thread(target=_do_upload, daemon=True).start()
+        IO_POOL.submit(func).add_done_callback(_done)
 
     def _after_upload(self, remote_dir: str, filename: str, err: Optional[Exception]):
         self._transfer_in_progress = False
@@ -583,6 +1057,7 @@ class RemoteFileBrowserFrame(ttk.Frame):
         if err is None:
             self.status_var.set(f"Uploaded {filename} to {remote_dir}")
             # Refresh listing
+            self._invalidate_dir(remote_dir, include_parent=True)
             self.list_directory(remote_dir)
         else:
             self.status_var.set(f"Upload failed: {err}")
@@ -594,7 +1069,7 @@ class RemoteFileBrowserFrame(ttk.Frame):
             messagebox.showwarning("Not Connected", "Please connect to a server first.")
             return
 
-        if getattr(self, '_transfer_in_progress', False):
+        if self._transfer_in_progress:
             self.status_var.set("Another transfer is in progress. Please wait...")
             return
 
@@ -611,7 +1086,7 @@ class RemoteFileBrowserFrame(ttk.Frame):
             return
 
         filename = item['text']
-        remote_path = posixpath.normpath(posixpath.join(self.current_path.get(), filename))
+        remote_path = _remote_path(self.current_path.get(), filename)
 
         # Ask for local save location
         # center native dialog by passing parent
@@ -632,19 +1107,9 @@ class RemoteFileBrowserFrame(ttk.Frame):
         self.status_var.set(f"Downloading {filename}...")
         self.set_enabled(False)
 
-        def _do_download():
-            err = None
-            try:
-                self.sftp_client.get(remote_path, str(local_path_obj))
-            except Exception as e:
-                err = e
-            finally:
-                try:
-                    self.after(0, lambda: self._after_download(filename, str(local_path_obj), err))
-                except Exception:
-                    pass
-
-        threading.Thread(target=_do_download, daemon=True).start()
+        self._run_in_background(
+            lambda: self._download_file(remote_path, str(local_path_obj), self._transfer_progress("Downloading", filename)),
+            lambda err: self._after_download(filename, str(local_path_obj), err))
 
     def _after_download(self, filename: str, local_path: str, err: Optional[Exception]):
         self._transfer_in_progress = False
@@ -664,114 +1129,260 @@ class RemoteFileBrowserFrame(ttk.Frame):
         self.editor_text.config(state=state)
 
     def _on_text_modified(self, event=None):
-        # Tk sets the modified flag continuously; we need to reset it
-        if self.editor_text.edit_modified():
-            self._editor_dirty = True
-            self.status_var.set(f"Editing: {self.open_file_path or ''} (modified)")
-            self.editor_text.edit_modified(False)
-
-    def open_remote_file(self, remote_path: str):
+        if self._editor_loading:
+            return
+        # <<Modified>> only fires when Tk's flag flips. Leaving it set until the next
+        # load/save means one event per editing session, not one per keystroke.
+        modified = bool(self.editor_text.edit_modified())
+        if modified != self._editor_dirty:
+            self._editor_dirty = modified
+            suffix = " (modified)" if modified else ""
+            self.status_var.set(f"Editing: {self.open_file_path or ''}{suffix}")
+
+    def open_remote_file(self, remote_path: str, attr=None):
+        """Read a remote file in the background and load it into the editor.
+
+        `attr` is the listing's SFTPAttributes for the file, if known; it saves a stat round trip.
+        """
         if not self.sftp_client:
             return
+        pool = self._sftp_pool
+        self.status_var.set(f"Opening {remote_path}...")
+
+        def _do_open():
+            text, warning, err = None, None, None
+            try:
+                with pool.borrow() as sftp:
+                    text, warning = self._read_remote_text(sftp, remote_path, attr)
+            except Exception as e:
+                err = e
+            try:
+                self.after(0, lambda: self._after_open(remote_path, text, warning, err))
+            except Exception:
+                pass
+
+        IO_POOL.submit(_do_open)
+
+    def _read_remote_text(self, sftp, remote_path: str, attr=None):
+        """Return (text, warning) for a remote file; warning is a (title, message) pair."""
         # Limit preview size to ~2MB to avoid freezing UI
         MAX_PREVIEW_BYTES = 2_000_000
-        try:
-            attr = self.sftp_client.stat(remote_path)
-            if stat.S_ISDIR(attr.st_mode):
-                return
-            if attr.st_size > MAX_PREVIEW_BYTES:
-                messagebox.showwarning("Large File", "File is larger than 2MB. Download it instead for viewing.")
-                return
-            with self.sftp_client.open(remote_path, 'r') as f:
-                raw = f.read()
-            if b'\x00' in raw:
-                messagebox.showwarning("Binary File", "This file appears to be binary and cannot be previewed.")
-                return
-            try:
-                text = raw.decode('utf-8')
-            except UnicodeDecodeError:
-                # Fallback with replacement to display something
-                text = raw.decode('utf-8', errors='replace')
-            # Load into editor
+        # Listing attrs are lstat()s: only trust them for regular files, not symlinks
+        if attr is None or not stat.S_ISREG(getattr(attr, 'st_mode', 0) or 0):
+            attr = sftp.stat(remote_path)
+        if stat.S_ISDIR(attr.st_mode):
+            return None, None
+        if attr.st_size > MAX_PREVIEW_BYTES:
+            return None, ("Large File", "File is larger than 2MB. Download it instead for viewing.")
+        # Decode block by block as data arrives; invalid bytes become U+FFFD
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        parts = []
+        with sftp.open(remote_path, 'rb') as f:
+            # Request every block up front instead of one 32 KiB round trip at a time
+            _prefetch(f, attr.st_size)
+            while True:
+                block = f.read(65536)
+                if not block:
+                    break
+                if b'\x00' in block:
+                    return None, ("Binary File", "This file appears to be binary and cannot be previewed.")
+                parts.append(decoder.decode(block))
+        parts.append(decoder.decode(b'', final=True))
+        return ''.join(parts), None
+
+    def _after_open(self, remote_path: str, text: Optional[str], warning, err: Optional[Exception]):
+        if err is not None:
+            self.status_var.set(f"Open failed: {err}")
+            messagebox.showerror("Open Failed", f"Could not open remote file:\n{err}")
+            return
+        if warning is not None:
+            self.status_var.set(f"Listing {self.current_path.get()}")
+            messagebox.showwarning(*warning)
+            return
+        if text is None:
+            return
+        # Load into editor in slices so one huge insert doesn't stall the event loop
+        self._editor_load_seq += 1
+        self._editor_loading = True
+        self._set_editor_enabled(False)
+        # No undo records for the bulk insert; turned back on once loading finishes
+        self.editor_text.config(state='normal', undo=False)
+        self.editor_text.delete('1.0', 'end')
+        self.editor_text.config(state='disabled')
+        self._clear_search_highlight()
+        self.status_var.set(f"Loading {remote_path}...")
+        self._feed_editor(self._editor_load_seq, remote_path, text, 0)
+
+    def _feed_editor(self, seq: int, remote_path: str, text: str, offset: int):
+        if seq != self._editor_load_seq:
+            return
+        if offset < len(text):
             self.editor_text.config(state='normal')
-            self.editor_text.delete('1.0', 'end')
-            self.editor_text.insert('1.0', text)
-            self.editor_text.edit_modified(False)
-            self._editor_dirty = False
-            self.open_file_path = remote_path
-            self._clear_search_highlight()
-            self._set_editor_enabled(True)
-            self.status_var.set(f"Opened: {remote_path}")
-        except Exception as e:
-            messagebox.showerror("Open Failed", f"Could not open remote file:\n{e}")
+            self.editor_text.insert('end-1c', text[offset:offset + _EDITOR_LOAD_CHUNK])
+            self.editor_text.config(state='disabled')
+            self.after_idle(self._feed_editor, seq, remote_path, text, offset + _EDITOR_LOAD_CHUNK)
+            return
+        self._editor_loading = False
+        # Loading isn't an edit: nothing to undo, not dirty
+        self.editor_text.edit_reset()
+        self.editor_text.config(undo=True)
+        self.editor_text.edit_modified(False)
+        self.editor_text.mark_set('insert', '1.0')
+        self._editor_dirty = False
+        self.open_file_path = remote_path
+        self._set_editor_enabled(True)
+        self.status_var.set(f"Opened: {remote_path}")
+
+    def _abandon_editor_load(self):
+        """Clear a partly loaded file whose remaining slices were cancelled, and re-enable undo."""
+        self._editor_loading = False
+        self.editor_text.config(state='normal', undo=True)
+        self.editor_text.delete('1.0', 'end')
+        self.editor_text.edit_reset()
+        self.editor_text.edit_modified(False)
+        self.editor_text.config(state='disabled')
+        self._editor_dirty = False
+        self.open_file_path = None
 
     def save_open_file(self):
         if not self.sftp_client or not self.open_file_path:
             return
-        content = self.editor_text.get('1.0', 'end-1c')
         if not messagebox.askyesno("Confirm Save", f"Save changes to {self.open_file_path}?"):
             return
         self.status_var.set("Saving...")
         self._set_editor_enabled(False)
+        # Tk must be read on this thread; encoding is left to the worker
+        content = self.editor_text.get('1.0', 'end-1c')
+        remote_path = self.open_file_path
+
+        pool = self._sftp_pool
+        load_seq = self._editor_load_seq
+        saved = {}
 
         def _do_save():
-            err = None
-            try:
-                with self.sftp_client.open(self.open_file_path, 'w') as f:
-                    f.write(content)
-            except Exception as e:
-                err = e
-            finally:
+            data = content.encode('utf-8')
+            with pool.borrow() as sftp:
+                with sftp.open(remote_path, 'wb') as f:
+                    # Don't wait for each write's ack; errors still surface on close
+                    f.set_pipelined(True)
+                    view = memoryview(data)
+                    for offset in range(0, len(view), _TRANSFER_CHUNK_SIZE):
+                        f.write(view[offset:offset + _TRANSFER_CHUNK_SIZE])
+                # lstat like the listing does, so the row can be patched instead of re-listed
                 try:
-                    self.after(0, lambda: self._after_save(err))
+                    saved['attr'] = sftp.lstat(remote_path)
                 except Exception:
                     pass
 
-        threading.Thread(target=_do_save, daemon=True).start()
-
-    def _after_save(self, err: Optional[Exception]):
-        self._set_editor_enabled(True)
+        self._run_in_background(
+            _do_save, lambda err: self._after_save(err, remote_path, pool, load_seq, saved.get('attr')))
+
+    def _after_save(self, err: Optional[Exception], remote_path: str, pool: SFTPPool,
+                    load_seq: int, attr=None):
+        # The editor and tree may have moved on while saving: another file opened,
+        # or the connection dropped or switched servers
+        connected = pool is self._sftp_pool
+        same_file = (connected and load_seq == self._editor_load_seq
+                     and not self._editor_loading and self.open_file_path == remote_path)
+        if same_file:
+            self._set_editor_enabled(True)
         if err is None:
-            self._editor_dirty = False
-            self.editor_text.edit_modified(False)
-            self.status_var.set(f"Saved: {self.open_file_path}")
-            # Optionally refresh directory to update size/mtime
+            if same_file:
+                self._editor_dirty = False
+                self.editor_text.edit_modified(False)
+            self.status_var.set(f"Saved: {remote_path}")
+            if not connected:
+                return
+            parent = posixpath.dirname(remote_path)
+            self._invalidate_dir(parent)
             cur = self.current_path.get()
-            self.list_directory(cur)
+            if parent != cur:
+                return
+            # Patch the saved file's row in place; re-list only if it can't be found
+            iid = self._find_row(posixpath.basename(remote_path)) if attr is not None else None
+            if iid is None:
+                self.list_directory(cur)
+                return
+            attr.filename = posixpath.basename(remote_path)
+            self._attr_by_iid[iid] = attr
+            self._update_row_attrs(iid, attr)
         else:
             self.status_var.set(f"Save failed: {err}")
             messagebox.showerror("Save Failed", f"Could not save file:\n{err}")
 
     def _clear_search_highlight(self):
+        self._highlight_pattern = ''
+        if self._highlight_after_id:
+            self.after_cancel(self._highlight_after_id)
+            self._highlight_after_id = None
         self.editor_text.tag_remove('search_highlight', '1.0', 'end')
 
     def _highlight_all(self, pattern: str):
         self._clear_search_highlight()
+        self._highlight_pattern = pattern
+        self._highlight_visible()
+
+    def _on_editor_yscroll(self, first, last):
+        self.editor_vscroll.set(first, last)
+        self._schedule_highlight()
+
+    def _schedule_highlight(self):
+        # Re-tag once scrolling/resizing settles instead of on every step
+        if not self._highlight_pattern:
+            return
+        if self._highlight_after_id:
+            self.after_cancel(self._highlight_after_id)
+        self._highlight_after_id = self.after(50, self._highlight_visible)
+
+    def _highlight_visible(self):
+        """Tag matches of the current search term on the lines in view only."""
+        self._highlight_after_id = None
+        text = self.editor_text
+        text.tag_remove('search_highlight', '1.0', 'end')
+        pattern = self._highlight_pattern
         if not pattern:
             return
-        start = '1.0'
-        while True:
-            idx = self.editor_text.search(pattern, start, stopindex='end')
-            if not idx:
-                break
-            end = f"{idx}+{len(pattern)}c"
-            self.editor_text.tag_add('search_highlight', idx, end)
-            start = end
+        # Widen to whole lines so matches straddling the viewport edge are kept
+        start = text.index('@0,0 linestart')
+        stop = text.index(f'@0,{text.winfo_height()} lineend')
+        # Scan the visible text with str.find and tag every hit in one Tcl call,
+        # instead of a Text.search round trip per match
+        visible = text.get(start, stop)
+        size = len(pattern)
+        ranges = []
+        pos = visible.find(pattern)
+        while pos != -1:
+            ranges.append(f"{start}+{pos}c")
+            ranges.append(f"{start}+{pos + size}c")
+            pos = visible.find(pattern, pos + size)
+        if ranges:
+            text.tag_add('search_highlight', *ranges)
+
+    def _on_search_key(self, event=None):
+        # Highlight once typing pauses rather than on every keystroke
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(150, self._flush_search_key)
+
+    def _flush_search_key(self):
+        self._search_after_id = None
+        pattern = self.search_var.get()
+        if pattern != self._highlight_pattern:
+            self._highlight_all(pattern)
 
     def find_next(self):
         pattern = self.search_var.get()
         if not pattern:
             return
-        self._highlight_all(pattern)
-        # Find next from current insert position
-        start = self.editor_text.index('insert')
-        idx = self.editor_text.search(pattern, start, stopindex='end')
+        if pattern != self._highlight_pattern:
+            self._highlight_all(pattern)
+        # Find next from the cursor; with no stop index Tk wraps around the end itself
+        idx = self.editor_text.search(pattern, 'insert')
         if not idx:
-            # Wrap around
-            idx = self.editor_text.search(pattern, '1.0', stopindex='end')
-            if not idx:
-                return
+            return
         end = f"{idx}+{len(pattern)}c"
         self.editor_text.see(idx)
         self.editor_text.tag_remove('sel', '1.0', 'end')
         self.editor_text.tag_add('sel', idx, end)
+        # Continue after this match on the next press
+        self.editor_text.mark_set('insert', end)
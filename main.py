@@ -9,7 +9,7 @@ import tkinter as tk
 from tkinter import messagebox
 from utils import bring_window_to_front
 
-# Paramiko dependency is required; it's imported in ssh_connection module.
+# Paramiko is imported lazily by SSHConnection on the first connect.
 from main_window import ServerManagerGUI
 
 def main():
@@ -33,14 +33,18 @@ def main():
     except Exception:
         pass
     
+    app = None
+
     def on_closing():
         if messagebox.askokcancel("Quit", "Do you want to quit?"):
+            if app is not None:
+                app.shutdown()
             root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
     
     try:
-        ServerManagerGUI(root)
+        app = ServerManagerGUI(root)
         try:
             bring_window_to_front(root)
         except Exception:
@@ -1,12 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import bisect
 import os
-import threading
-from typing import Optional
+import re
+import shlex
+from typing import Dict, List, Optional
 
 from utils import center_window, resource_path, bring_window_to_front, load_icon
 from credentials import CredentialManager
-from ssh_connection import SSHConnection
+from ssh_connection import IO_POOL, SSHConnection
 from file_browser import RemoteFileBrowserFrame
 from dialogs import ServerDialog
 from json_viewer import JSONViewerWindow
@@ -16,17 +18,53 @@ from text_diff import TextDiffWindow
 class ServerManagerGUI:
     """Main GUI application for SSH server management."""
 
+    # Remote commands per service action; {s} is the shell-quoted service name
+    _SVC_CMDS = {
+        # --no-block queues the job and returns, so a slow unit doesn't hold a shell until it settles
+        'start': 'sudo -n systemctl --no-block start {s} || systemctl --no-block start {s}',
+        'stop': 'sudo -n systemctl --no-block stop {s} || systemctl --no-block stop {s}',
+        'status': 'systemctl status --no-pager {s}',
+    }
+    # Most log bytes shown in the logs pane; 100 journal lines of a restart loop can run to megabytes
+    _LOGS_MAX_BYTES = 256 * 1024
+    # Root whose ttk styles were already configured (styles are per Tk interpreter)
+    _styled_root = None
+
     def __init__(self, root):
         self.root = root
         self.root.title("Backend Support Manager")
         # Geometry is set by the launcher
 
-        self.credential_manager = CredentialManager()
+        self.credential_manager = CredentialManager(root=self.root)
         self.ssh_connection = SSHConnection()
         self.connected_server_name: Optional[str] = None
+        # Pending Tk `after` id for the debounced service status poll, whether a poll is
+        # running, and whether another was requested meanwhile
+        self._svc_refresh_after: Optional[str] = None
+        self._svc_refresh_inflight = False
+        self._svc_refresh_again = False
+        # Last state/selectmode applied to the service controls, so unchanged ones are not reconfigured
+        self._widget_states: Dict[tk.Misc, str] = {}
+        self._svc_selectmode: Optional[str] = None
+        # Services tree row id -> service name, kept in step with inserts/deletes
+        self._svc_names: Dict[str, str] = {}
+        # Service name -> row id, the reverse of _svc_names, for O(1) existence checks
+        self._svc_iids: Dict[str, str] = {}
+        # Services tree row id -> status text currently shown in that row
+        self._svc_status: Dict[str, str] = {}
+        # Server names currently rendered in server_tree, and their row ids
+        self._displayed_servers: List[str] = []
+        self._server_iids: Dict[str, str] = {}
+        # Incremented per log fetch; only the newest result is rendered
+        self._logs_seq = 0
+        self._logs_shown: Optional[str] = None
+        # (logs text, query, [(line, col), ...]) for the last Find in the logs pane
+        self._logs_matches: Optional[tuple] = None
 
         self.setup_ui()
         self.refresh_server_list()
+        # Warm the paramiko import once the window is up, so the first connect doesn't pay for it
+        self.root.after(1000, lambda: IO_POOL.submit(self.ssh_connection.preload))
 
     def setup_ui(self):
         # Menu bar
@@ -80,7 +118,7 @@ class ServerManagerGUI:
         self._server_icon = None
         try:
             # 16px fits the configured rowheight
-            self._server_icon = load_icon(16, 'server_manager_icons', 'server.png')
+            self._server_icon = load_icon(16, 'server_manager_icons', 'server.png', master=self.root)
         except Exception:
             self._server_icon = None
 
@@ -89,6 +127,9 @@ class ServerManagerGUI:
         scrollbar = ttk.Scrollbar(servers_frame, orient='vertical', command=self.server_tree.yview)
         self.server_tree.configure(yscrollcommand=scrollbar.set)
         self.server_tree.grid(row=0, column=0, sticky=(tk.N, tk.S, tk.E, tk.W))
+        # Rows carry the icon through a shared tag rather than a per-row image option
+        if self._server_icon:
+            self.server_tree.tag_configure('server', image=self._server_icon)
         scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
 
         # Double-click action on server item
@@ -107,13 +148,15 @@ class ServerManagerGUI:
         right_panel.rowconfigure(0, weight=1)
 
         # Style: add padding to tab labels and margins, and spacing between tabs and content; ensure server list row height 16
-        try:
-            style = ttk.Style(self.root)
-            style.configure('Custom.TNotebook.Tab', padding=(12, 6))
-            style.configure('Custom.TNotebook', tabmargins=(6, 6, 6, 0))
-            style.configure('ServerList.Treeview', rowheight=16)
-        except Exception:
-            pass
+        if ServerManagerGUI._styled_root is not self.root:
+            try:
+                style = ttk.Style(self.root)
+                style.configure('Custom.TNotebook.Tab', padding=(12, 6))
+                style.configure('Custom.TNotebook', tabmargins=(6, 6, 6, 0))
+                style.configure('ServerList.Treeview', rowheight=16)
+                ServerManagerGUI._styled_root = self.root
+            except Exception:
+                pass
 
         notebook = ttk.Notebook(right_panel, style='Custom.TNotebook')
         notebook.grid(row=0, column=0, sticky=(tk.N, tk.S, tk.E, tk.W))
@@ -129,11 +172,11 @@ class ServerManagerGUI:
         file_actions_right.pack(side=tk.RIGHT)
         # Load toolbar icons
         try:
-            self._icon_upload = load_icon(18, 'server_manager_icons', 'upload.png')
+            self._icon_upload = load_icon(18, 'server_manager_icons', 'upload.png', master=self.root)
         except Exception:
             self._icon_upload = None
         try:
-            self._icon_download = load_icon(18, 'server_manager_icons', 'download.png')
+            self._icon_download = load_icon(18, 'server_manager_icons', 'download.png', master=self.root)
         except Exception:
             self._icon_download = None
         self.upload_button = ttk.Button(
@@ -171,23 +214,23 @@ class ServerManagerGUI:
         actions_right.pack(side=tk.RIGHT)
         # Load action icons
         try:
-            self._icon_start = load_icon(18, 'server_manager_icons', 'start.png')
+            self._icon_start = load_icon(18, 'server_manager_icons', 'start.png', master=self.root)
         except Exception:
             self._icon_start = None
         try:
-            self._icon_stop = load_icon(18, 'server_manager_icons', 'stop.png')
+            self._icon_stop = load_icon(18, 'server_manager_icons', 'stop.png', master=self.root)
         except Exception:
             self._icon_stop = None
         try:
-            self._icon_status = load_icon(18, 'server_manager_icons', 'status.png')
+            self._icon_status = load_icon(18, 'server_manager_icons', 'status.png', master=self.root)
         except Exception:
             self._icon_status = None
         try:
-            self._icon_add_service = load_icon(18, 'server_manager_icons', 'add_service.png')
+            self._icon_add_service = load_icon(18, 'server_manager_icons', 'add_service.png', master=self.root)
         except Exception:
             self._icon_add_service = None
         try:
-            self._icon_remove_service = load_icon(18, 'server_manager_icons', 'remove_service.png')
+            self._icon_remove_service = load_icon(18, 'server_manager_icons', 'remove_service.png', master=self.root)
         except Exception:
             self._icon_remove_service = None
 
@@ -225,8 +268,7 @@ class ServerManagerGUI:
                 return
             self.services_tree.selection_set(row_id)
             self.services_tree.focus(row_id)
-            vals = self.services_tree.item(row_id).get('values') or []
-            service = vals[0] if vals else ''
+            service = self._svc_names.get(row_id, '')
             if service:
                 self._fetch_service_logs_async(service)
         self.services_tree.bind('<Double-1>', _on_services_double_click)
@@ -301,57 +343,70 @@ class ServerManagerGUI:
         status_bar = ttk.Label(main_frame, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
         status_bar.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(8, 0))
 
-        try:
-            self.root.after(150, self._set_initial_sash)
-        except Exception:
-            pass
+        # Place the sash once, on the first real layout of the paned window
+        self._paned_configure_bid = self.paned.bind('<Configure>', self._on_paned_first_configure, add='+')
         # Make sure the main window is frontmost when initialized
         try:
             bring_window_to_front(self.root)
         except Exception:
             pass
 
-    def _set_initial_sash(self):
+    def _on_paned_first_configure(self, event):
+        # Keep listening until the sash actually lands; no timed retries
+        if event.width <= 1 or not self._set_initial_sash(event.width):
+            return
         try:
-            self.root.update_idletasks()
-            pw = self.paned.winfo_width()
-            if pw <= 1:
-                self.root.after(150, self._set_initial_sash)
-                return
-            desired_left = int(pw * 0.25)
-            min_side = 150
-            max_left = max(min_side, pw - min_side)
-            pos = max(min_side, min(desired_left, max_left))
-            try:
-                self.paned.sashpos(0, pos)
-            except Exception:
-                self.root.after(150, lambda: self._safe_set_sash(pos))
+            self.paned.unbind('<Configure>', self._paned_configure_bid)
         except Exception:
             pass
 
-    def _safe_set_sash(self, pos: int):
+    def _set_initial_sash(self, pw: int) -> bool:
+        min_side = 150
+        max_left = max(min_side, pw - min_side)
+        pos = max(min_side, min(int(pw * 0.25), max_left))
         try:
             self.paned.sashpos(0, pos)
-        except Exception:
-            pass
+        except tk.TclError:
+            return False
+        return True
 
     def set_controls_enabled(self, enabled: bool):
         try:
             self.server_tree.configure(selectmode='browse' if enabled else 'none')
-        except Exception:
+        except tk.TclError:
+            # Widget already destroyed during shutdown
             pass
 
     def refresh_server_list(self):
-        try:
-            for iid in self.server_tree.get_children(''):
+        """Patch server_tree to match the stored servers, touching only changed rows."""
+        new = self.credential_manager.list_servers()
+        if new == self._displayed_servers:
+            return
+        keep = set(new)
+        removed = [n for n in self._displayed_servers if n not in keep]
+        added = [(i, n) for i, n in enumerate(new) if n not in self._server_iids]
+        if len(removed) == 1 and len(added) == 1:
+            # A rename: relabel and move the existing row so it keeps its selection/focus
+            index, server_name = added[0]
+            iid = self._server_iids.pop(removed[0])
+            self.server_tree.item(iid, text=server_name)
+            self.server_tree.move(iid, '', index)
+            self._server_iids[server_name] = iid
+            self._displayed_servers = new
+            return
+        for server_name in removed:
+            iid = self._server_iids.pop(server_name, None)
+            if iid and self.server_tree.exists(iid):
                 self.server_tree.delete(iid)
-        except Exception:
-            pass
-        for server_name in self.credential_manager.list_servers():
-            try:
-                self.server_tree.insert('', 'end', text=server_name, image=self._server_icon)
-            except Exception:
-                self.server_tree.insert('', 'end', text=server_name)
+        # Both lists are sorted, so inserting missing names at their index keeps order
+        insert = self.server_tree.insert
+        # Rows past the current end are appended; Tk walks the child list for a numeric index
+        count = len(self._displayed_servers) - len(removed)
+        for index, server_name in added:
+            position = 'end' if index >= count else index
+            self._server_iids[server_name] = insert('', position, text=server_name, tags=('server',))
+            count += 1
+        self._displayed_servers = new
 
     def add_server_dialog(self):
         dialog = ServerDialog(self.root, "Add Server")
@@ -370,9 +425,12 @@ class ServerManagerGUI:
         dialog = ServerDialog(self.root, "Edit Server", server_data, server_name)
         if dialog.result:
             new_name, host, username, password, port = dialog.result
-            self.credential_manager.add_server(new_name, host, username, password, port)
             if new_name != server_name:
-                self.credential_manager.delete_server(server_name)
+                # Move the whole entry so favorites, keepalive and compression settings follow
+                self.credential_manager.rename_server(server_name, new_name)
+                if self.connected_server_name == server_name:
+                    self.connected_server_name = new_name
+            self.credential_manager.add_server(new_name, host, username, password, port)
             self.refresh_server_list()
             self.status_var.set(f"Updated server: {new_name}")
 
@@ -396,7 +454,7 @@ class ServerManagerGUI:
         if not self.ssh_connection.is_connected() or self.connected_server_name != server_name:
             self.connect_to_server_by_name(server_name)
         else:
-            self.file_browser.attach_client(self.ssh_connection.client)
+            self.file_browser.attach_client(self.ssh_connection.client, self.ssh_connection.executor)
 
     def connect_to_server(self):
         server_name = self._get_selected_server_name()
@@ -408,11 +466,12 @@ class ServerManagerGUI:
     def _get_selected_server_name(self) -> Optional[str]:
         try:
             sel = self.server_tree.selection()
-            if not sel:
-                return None
-            return self.server_tree.item(sel[0]).get('text') or None
-        except Exception:
+        except tk.TclError:
+            return None
+        if not sel:
             return None
+        # str(): ttk converts numeric-looking text such as '123' to int
+        return str(self.server_tree.item(sel[0], 'text')) or None
 
     def connect_to_server_by_name(self, server_name: str):
         if self.ssh_connection.is_connected():
@@ -424,22 +483,37 @@ class ServerManagerGUI:
             return
         self.status_var.set(f"Connecting to {server_name}...")
         self.set_controls_enabled(False)
-        def connect_thread():
-            success, message = self.ssh_connection.connect(
-                server_data['host'],
-                server_data['username'],
-                server_data['password'],
-                server_data['port']
-            )
-            self.root.after(0, lambda: self.connection_result(success, message, server_name))
-        threading.Thread(target=connect_thread, daemon=True).start()
+        fut = IO_POOL.submit(
+            self.ssh_connection.connect,
+            server_data['host'],
+            server_data['username'],
+            server_data['password'],
+            server_data['port'],
+            server_data.get('keepalive_interval', 30),
+            bool(server_data.get('compress', True))
+        )
+
+        def done(f):
+            # A raised or cancelled connect must still reach connection_result, or the UI
+            # would stay on "Connecting..." with the server controls disabled
+            if f.cancelled():
+                result = (False, "Connection cancelled")
+            elif f.exception() is not None:
+                result = (False, f"Connection failed: {f.exception()}")
+            else:
+                result = f.result()
+            try:
+                self.root.after(0, self.connection_result, *result, server_name)
+            except Exception:
+                pass  # main window already destroyed
+        fut.add_done_callback(done)
 
     def connection_result(self, success: bool, message: str, server_name: str):
         self.set_controls_enabled(True)
         self.status_var.set(message)
         if success:
             self.connected_server_name = server_name
-            self.file_browser.attach_client(self.ssh_connection.client)
+            self.file_browser.attach_client(self.ssh_connection.client, self.ssh_connection.executor)
             self.upload_button.config(state='normal')
             self.download_button.config(state='normal')
             self._load_services_for_connected()
@@ -452,13 +526,14 @@ class ServerManagerGUI:
 
     def disconnect_from_server(self):
         if self.ssh_connection.is_connected():
+            self.credential_manager.flush()
             self.ssh_connection.disconnect()
             self.connected_server_name = None
             self.file_browser.attach_client(None)
             self.upload_button.config(state='disabled')
             self.download_button.config(state='disabled')
             try:
-                self.services_tree.delete(*self.services_tree.get_children())
+                self._clear_service_rows()
                 self._set_services_ui_enabled(False)
             except Exception:
                 pass
@@ -475,7 +550,7 @@ class ServerManagerGUI:
 
     def _load_services_for_connected(self):
         try:
-            self.services_tree.delete(*self.services_tree.get_children())
+            self._clear_service_rows()
         except Exception:
             pass
         if not self.connected_server_name:
@@ -483,35 +558,37 @@ class ServerManagerGUI:
             return
         svcs = self.credential_manager.get_services(self.connected_server_name)
         for s in svcs:
-            self.services_tree.insert('', 'end', values=(s, ''))
+            self._insert_service_row(s)
         self._set_services_ui_enabled(self.ssh_connection.is_connected())
-        self._update_service_actions_state()
         self._refresh_services_status_async()
 
     def _set_services_ui_enabled(self, enabled: bool):
-        state = 'normal' if enabled else 'disabled'
-        for w in (self.remove_service_btn, self.svc_start_btn, self.svc_stop_btn, self.svc_status_btn, getattr(self, 'svc_add_btn', None)):
+        selectmode = 'browse' if enabled else 'none'
+        if self._svc_selectmode != selectmode:
             try:
-                if w is not None:
-                    w.config(state=state)
-            except Exception:
+                self.services_tree.configure(selectmode=selectmode)
+                self._svc_selectmode = selectmode
+            except tk.TclError:
                 pass
-        try:
-            self.services_tree.configure(selectmode='browse' if enabled else 'none')
-        except Exception:
-            pass
-        self._update_service_actions_state()
+        self._update_service_actions_state(enabled)
 
-    def _update_service_actions_state(self):
-        enabled = self.ssh_connection.is_connected()
-        sel = self.services_tree.selection()
-        is_sel = bool(sel)
+    def _update_service_actions_state(self, enabled: Optional[bool] = None):
+        if enabled is None:
+            enabled = self.ssh_connection.is_connected()
+        row_state = 'normal' if enabled and self.services_tree.selection() else 'disabled'
         for b in (self.remove_service_btn, self.svc_start_btn, self.svc_stop_btn, self.svc_status_btn):
-            b.config(state='normal' if (enabled and is_sel) else 'disabled')
+            self._set_widget_state(b, row_state)
+        self._set_widget_state(self.svc_add_btn, 'normal' if enabled else 'disabled')
+
+    def _set_widget_state(self, widget: tk.Misc, state: str):
+        """Configure `widget`'s state only when it differs from the last one set here."""
+        if self._widget_states.get(widget) == state:
+            return
         try:
-            self.svc_add_btn.config(state='normal' if enabled else 'disabled')
-        except Exception:
-            pass
+            widget.config(state=state)
+        except tk.TclError:
+            return
+        self._widget_states[widget] = state
 
     def _on_add_service_popup(self):
         if not self.ssh_connection.is_connected():
@@ -537,18 +614,10 @@ class ServerManagerGUI:
             if not val:
                 messagebox.showwarning('Validation', 'Please enter a service name.')
                 return
-            existing = []
-            try:
-                for iid in self.services_tree.get_children():
-                    vals = self.services_tree.item(iid).get('values') or []
-                    if vals:
-                        existing.append(str(vals[0]))
-            except Exception:
-                pass
-            if val in existing:
+            if val in self._svc_iids:
                 messagebox.showinfo('Service Exists', f"'{val}' is already in favorites.")
                 return
-            self.services_tree.insert('', 'end', values=(val, ''))
+            self._insert_service_row(val)
             self._persist_services()
             self._refresh_services_status_async()
             try:
@@ -571,32 +640,49 @@ class ServerManagerGUI:
         if not sel:
             return
         iid = sel[0]
-        vals = self.services_tree.item(iid).get('values') or []
-        name = vals[0] if vals else ''
+        name = self._svc_names.get(iid, '')
         if not messagebox.askyesno('Remove Service', f"Remove '{name}' from favorites?"):
             return
         try:
             self.services_tree.delete(iid)
         except Exception:
             pass
+        self._svc_names.pop(iid, None)
+        self._svc_iids.pop(name, None)
+        self._svc_status.pop(iid, None)
         self._persist_services()
         self._refresh_services_status_async()
         self._update_service_actions_state()
 
     def _persist_services(self):
+        """Record the favorites; CredentialManager debounces the disk write onto its writer thread."""
         if not self.connected_server_name:
             return
-        raw = []
-        try:
-            for iid in self.services_tree.get_children():
-                vals = self.services_tree.item(iid).get('values') or []
-                if vals:
-                    name = str(vals[0]).strip()
-                    if name:
-                        raw.append(name)
-        except Exception:
-            pass
-        self.credential_manager.set_services(self.connected_server_name, raw)
+        self.credential_manager.set_services(self.connected_server_name, self._tree_service_names())
+
+    def shutdown(self):
+        """Flush pending state before the main window is destroyed."""
+        self.credential_manager.flush(wait=True)
+        IO_POOL.shutdown(wait=False, cancel_futures=True)
+        self.ssh_connection.disconnect()
+        SSHConnection.close_all()
+
+    def _tree_service_names(self):
+        """Return the service names currently shown in the services tree, in order."""
+        return [n for n in self._svc_names.values() if n]
+
+    def _insert_service_row(self, name: str, status: str = '') -> str:
+        iid = self.services_tree.insert('', 'end', values=(name, status))
+        self._svc_names[iid] = name
+        self._svc_iids[name] = iid
+        self._svc_status[iid] = status
+        return iid
+
+    def _clear_service_rows(self):
+        self._svc_names.clear()
+        self._svc_iids.clear()
+        self._svc_status.clear()
+        self.services_tree.delete(*self.services_tree.get_children())
 
     def _svc_action(self, action: str):
         if not self.ssh_connection.is_connected():
@@ -605,34 +691,30 @@ class ServerManagerGUI:
         sel = self.services_tree.selection()
         if not sel:
             return
-        vals = self.services_tree.item(sel[0]).get('values') or []
-        service = vals[0] if vals else ''
-        cmd = None
-        if action in ('start', 'stop', 'status'):
-            if action == 'status':
-                cmd = f"systemctl status --no-pager {service}"
-            else:
-                cmd = f"sudo -n systemctl {action} {service} || systemctl {action} {service}"
-        if not cmd:
+        service = self._svc_names.get(sel[0], '')
+        template = self._SVC_CMDS.get(action)
+        if not template or not service:
             return
+        cmd = template.format(s=shlex.quote(service))
         if action in ('start', 'stop'):
-            try:
-                self.ssh_connection.client.exec_command(cmd)
-            except Exception as e:
-                messagebox.showerror('SSH Error', f"Failed to execute command:\n{e}")
-                return
-            self.root.after(500, self._refresh_services_status_async)
-            self.root.after(600, lambda s=service: self._fetch_service_logs_async(s))
+            executor = self.ssh_connection.executor
+            def worker():
+                try:
+                    executor.run(cmd)
+                except Exception as e:
+                    self.root.after(0, lambda err=e: messagebox.showerror('SSH Error', f"Failed to execute command:\n{err}"))
+                    return
+                self.root.after(0, lambda: self.status_var.set(f"Requested {action} of {service}"))
+                self.root.after(500, self._refresh_services_status_async)
+                self.root.after(600, lambda s=service: self._fetch_service_logs_async(s))
+            IO_POOL.submit(worker)
         elif action == 'status':
             self._run_remote_cmd(cmd, title=f"systemctl {action} {service}")
 
     def _run_remote_cmd(self, cmd: str, title: str = 'Command Output'):
-        try:
-            stdin, stdout, stderr = self.ssh_connection.client.exec_command(cmd)
-            out = stdout.read().decode('utf-8', errors='replace')
-            err = stderr.read().decode('utf-8', errors='replace')
-        except Exception as e:
-            messagebox.showerror('SSH Error', f"Failed to execute command:\n{e}")
+        """Open an output window right away and fill it in when `cmd` finishes in the background."""
+        executor = self.ssh_connection.executor
+        if executor is None:
             return
         dlg = tk.Toplevel(self.root)
         dlg.title(title)
@@ -647,7 +729,7 @@ class ServerManagerGUI:
         txt.configure(yscrollcommand=scr.set)
         txt.grid(row=0, column=0, sticky='nsew')
         scr.grid(row=0, column=1, sticky='ns')
-        txt.insert('1.0', out if out.strip() else err)
+        txt.insert('1.0', 'Running...')
         txt.config(state='disabled')
         ttk.Button(frm, text='Close', command=dlg.destroy).grid(row=1, column=0, pady=(8,0), sticky='e')
         try:
@@ -659,64 +741,109 @@ class ServerManagerGUI:
         except Exception:
             pass
 
+        def show(text: str):
+            try:
+                txt.config(state='normal')
+                txt.delete('1.0', 'end')
+                txt.insert('1.0', text)
+                txt.config(state='disabled')
+            except tk.TclError:
+                pass  # closed before the command finished
+        def worker():
+            try:
+                out, err, _ = executor.run(cmd)
+                text = out if out.strip() else err
+            except Exception as e:
+                text = f"Failed to execute command:\n{e}"
+            try:
+                self.root.after(0, show, text)
+            except Exception:
+                pass
+        IO_POOL.submit(worker)
+
     def _refresh_services_status_async(self):
+        """Poll service states shortly, coalescing bursts of requests into one remote call."""
+        if self._svc_refresh_after:
+            try:
+                self.root.after_cancel(self._svc_refresh_after)
+            except Exception:
+                pass
+        self._svc_refresh_after = self.root.after(200, self._poll_services_status)
+
+    def _poll_services_status(self):
+        self._svc_refresh_after = None
+        if self._svc_refresh_inflight:
+            # Run once more when the current poll lands, so the newest state is shown
+            self._svc_refresh_again = True
+            return
         if not self.ssh_connection.is_connected():
             return
+        # Snapshot from the tree, which is what the poll results are matched against
+        services = self._tree_service_names()
         def worker():
-            try:
-                services = self.credential_manager.get_services(self.connected_server_name or '')
-                statuses = []
-                for s in services:
-                    try:
-                        cmd = f"systemctl is-active {s} || true"
-                        stdin, stdout, stderr = self.ssh_connection.client.exec_command(cmd)
-                        out = stdout.read().decode('utf-8', errors='ignore').strip()
-                        status = out if out else 'unknown'
-                    except Exception:
-                        status = 'unknown'
-                    statuses.append((s, status))
-            except Exception:
-                statuses = []
-            def update_ui():
+            found = {}
+            if services:
                 try:
-                    prev_sel = None
-                    try:
-                        sel = self.services_tree.selection()
-                        if sel:
-                            vals = self.services_tree.item(sel[0]).get('values') or []
-                            prev_sel = vals[0] if vals else None
-                    except Exception:
-                        prev_sel = None
-                    self.services_tree.delete(*self.services_tree.get_children())
-                    selected_iid = None
-                    for name, st in statuses:
-                        iid = self.services_tree.insert('', 'end', values=(name, st))
-                        if prev_sel and name == prev_sel:
-                            selected_iid = iid
-                    if selected_iid:
-                        self.services_tree.selection_set(selected_iid)
-                        self.services_tree.focus(selected_iid)
+                    names = ' '.join(shlex.quote(s) for s in services)
+                    # One systemctl for all units prints one state per line, in argument order
+                    out, _, _ = self.ssh_connection.executor.run(f"systemctl is-active -- {names}")
+                    lines = out.splitlines()
+                    if len(lines) == len(services):
+                        found = {s: st.strip() for s, st in zip(services, lines)}
+                    else:
+                        # Not one line per unit (older systemd): ask per unit, tagging each line by name
+                        cmd = f"for s in {names}; do printf '%s\\t' \"$s\"; systemctl is-active \"$s\" || true; done"
+                        out, _, _ = self.ssh_connection.executor.run(cmd)
+                        for line in out.splitlines():
+                            name, sep, status = line.partition('\t')
+                            if sep:
+                                found.setdefault(name, status.strip())
                 except Exception:
                     pass
+            statuses = [(s, found.get(s) or 'unknown') for s in services]
+            def update_ui():
+                self._svc_refresh_inflight = False
+                if self._svc_refresh_again:
+                    self._svc_refresh_again = False
+                    self._refresh_services_status_async()
+                # The tree stays the source of truth: rows added or removed while the poll
+                # ran are left as they are, and only status cells that changed are rewritten
+                polled = dict(statuses)
+                shown = self._svc_status
+                try:
+                    for iid, name in self._svc_names.items():
+                        st = polled.get(name)
+                        if st is not None and shown.get(iid) != st:
+                            self.services_tree.set(iid, 'status', st)
+                            shown[iid] = st
+                except tk.TclError:
+                    pass
             try:
                 self.root.after(0, update_ui)
             except Exception:
                 pass
-        threading.Thread(target=worker, daemon=True).start()
+        self._svc_refresh_inflight = True
+        IO_POOL.submit(worker)
 
     def _fetch_service_logs_async(self, service: str):
         if not self.ssh_connection.is_connected() or not service:
             return
+        self._logs_seq += 1
+        seq = self._logs_seq
         def worker():
             try:
-                cmd = f"journalctl -u {service} -n 100 --no-pager --output=short-iso"
-                stdin, stdout, stderr = self.ssh_connection.client.exec_command(cmd)
-                out = stdout.read().decode('utf-8', errors='replace')
-                err = stderr.read().decode('utf-8', errors='replace')
+                # Trimmed on the remote side so an oversized journal is never sent or buffered whole
+                cmd = (f"journalctl -u {shlex.quote(service)} -n 100 --no-pager --output=short-iso"
+                       f" | tail -c {self._LOGS_MAX_BYTES}")
+                out, err, _ = self.ssh_connection.executor.run(cmd)
                 text = out if out.strip() else err
             except Exception as e:
                 text = f"Failed to fetch logs: {e}"
             def update_ui():
+                # Skip results overtaken by a newer fetch, and redraws that change nothing
+                if seq != self._logs_seq or text == self._logs_shown:
+                    return
+                self._logs_shown = text
                 try:
                     self.svc_logs_text.config(state='normal')
                     self.svc_logs_text.delete('1.0', 'end')
@@ -732,7 +859,27 @@ class ServerManagerGUI:
                 self.root.after(0, update_ui)
             except Exception:
                 pass
-        threading.Thread(target=worker, daemon=True).start()
+        IO_POOL.submit(worker)
+
+    def _log_match_positions(self, query: str) -> List[tuple]:
+        """Sorted (line, col) starts of case-insensitive `query` matches in the logs pane.
+
+        Computed once per (logs text, query) so repeated Find Next presses only bisect.
+        """
+        text = self._logs_shown
+        if text is None:
+            text = self.svc_logs_text.get('1.0', 'end-1c')
+        cached = self._logs_matches
+        if cached is not None and cached[0] is text and cached[1] == query:
+            return cached[2]
+        line_starts = [0]
+        line_starts.extend(m.end() for m in re.finditer('\n', text))
+        matches = []
+        for m in re.finditer(re.escape(query), text, re.IGNORECASE):
+            line = bisect.bisect_right(line_starts, m.start()) - 1
+            matches.append((line + 1, m.start() - line_starts[line]))
+        self._logs_matches = (text, query, matches)
+        return matches
 
     def _find_next_in_logs(self):
         try:
@@ -741,34 +888,23 @@ class ServerManagerGUI:
             query = ''
         if not query:
             return
+        # Tags, marks and scrolling work on a disabled Text, so the pane stays read-only here
+        text = self.svc_logs_text
         try:
-            prev_state = str(self.svc_logs_text.cget('state'))
-            self.svc_logs_text.config(state='normal')
-            try:
-                self.svc_logs_text.tag_remove('find_highlight', '1.0', 'end')
-            except Exception:
-                pass
-            start_index = self.svc_logs_text.index('insert')
-            pos = self.svc_logs_text.search(query, start_index, nocase=True, stopindex='end')
-            if not pos:
-                pos = self.svc_logs_text.search(query, '1.0', nocase=True, stopindex='end')
-            if pos:
-                end_pos = f"{pos}+{len(query)}c"
-                self.svc_logs_text.tag_add('find_highlight', pos, end_pos)
-                try:
-                    self.svc_logs_text.mark_set('insert', end_pos)
-                except Exception:
-                    pass
-                try:
-                    self.svc_logs_text.see(pos)
-                except Exception:
-                    pass
-            self.svc_logs_text.config(state=prev_state)
-        except Exception:
-            try:
-                self.svc_logs_text.config(state='disabled')
-            except Exception:
-                pass
+            text.tag_remove('find_highlight', '1.0', 'end')
+            matches = self._log_match_positions(query)
+            if not matches:
+                return
+            line, col = text.index('insert').split('.')
+            # First match at or after the cursor, wrapping to the top
+            i = bisect.bisect_left(matches, (int(line), int(col)))
+            pos = '%d.%d' % matches[i if i < len(matches) else 0]
+            end_pos = f"{pos}+{len(query)}c"
+            text.tag_add('find_highlight', pos, end_pos)
+            text.mark_set('insert', end_pos)
+            text.see(pos)
+        except tk.TclError:
+            pass
 
     def show_about(self):
         try:
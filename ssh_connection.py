@@ -1,16 +1,274 @@
-from typing import Optional, Tuple
-import paramiko
+import hashlib
+import select
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import paramiko
+
+
+# Shared worker threads for blocking SSH/SFTP calls (connect, commands, listings, transfers)
+IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='ssh-io')
+
+
+class RemoteExecutor:
+    """Runs commands over a few persistent remote shells instead of a new channel per command.
+
+    The shells run without a PTY, so there is no echo or prompt to strip and stderr
+    stays separate. Each command is followed by a unique marker on stdout (carrying
+    the exit status) and on stderr; output is read until both markers arrive.
+    Up to `max_shells` commands run at once, so a slow log fetch does not hold up
+    status polls or file-browser lookups.
+    """
+
+    def __init__(self, client: 'paramiko.SSHClient', max_shells: int = 3):
+        self._client = client
+        self._slots = threading.Semaphore(max_shells)
+        self._idle: List['paramiko.Channel'] = []
+        self._lock = threading.Lock()
+        # Bumped by close(); shells borrowed before that are closed when returned
+        self._generation = 0
+
+    def _open_shell(self) -> 'paramiko.Channel':
+        transport = self._client.get_transport()
+        if transport is None or not transport.is_active():
+            raise EOFError("SSH transport is not active")
+        chan = transport.open_session()
+        chan.exec_command('/bin/sh')
+        return chan
+
+    @staticmethod
+    def _close_chan(chan: 'paramiko.Channel'):
+        try:
+            chan.close()
+        except Exception:
+            pass
+
+    def _take_shell(self) -> Tuple['paramiko.Channel', int]:
+        with self._lock:
+            generation = self._generation
+            while self._idle:
+                chan = self._idle.pop()
+                if not (chan.closed or chan.exit_status_ready()):
+                    return chan, generation
+                self._close_chan(chan)
+        return self._open_shell(), generation
+
+    def _give_back(self, chan: 'paramiko.Channel', generation: int):
+        with self._lock:
+            if generation == self._generation:
+                self._idle.append(chan)
+                return
+        self._close_chan(chan)
+
+    def close(self):
+        """Close the idle shells; the next run() opens a new one."""
+        with self._lock:
+            self._generation += 1
+            idle, self._idle = self._idle, []
+        for chan in idle:
+            self._close_chan(chan)
+
+    def run(self, cmd: str, timeout: float = 30.0, errors: str = 'replace') -> Tuple[str, str, int]:
+        """Run `cmd` in a shared shell and return (stdout, stderr, exit_status).
+
+        Output is decoded as UTF-8 with `errors`; pass 'strict' to get a
+        UnicodeDecodeError instead of U+FFFD for bytes that are not valid UTF-8.
+        """
+        with self._slots:
+            chan, generation = self._take_shell()
+            try:
+                out, err, status = self._run_in(chan, cmd, timeout)
+            except BaseException:
+                # The shell is dead or mid-command; drop it rather than desync the framing
+                self._close_chan(chan)
+                raise
+            self._give_back(chan, generation)
+        return out.decode('utf-8', errors=errors), err.decode('utf-8', errors=errors), status
+
+    @staticmethod
+    def _run_in(chan: 'paramiko.Channel', cmd: str, timeout: float) -> Tuple[bytes, bytes, int]:
+        marker = f"__SSM_END_{uuid.uuid4().hex}__"
+        # stdin is /dev/null so commands cannot swallow the next request
+        chan.sendall(
+            f"{{ {cmd}\n}} </dev/null\n"
+            f"printf '\\n{marker} %d\\n' \"$?\"\n"
+            f"printf '\\n{marker}\\n' >&2\n"
+        )
+        out_mark = f"\n{marker} ".encode()
+        err_mark = f"\n{marker}\n".encode()
+        out = bytearray()
+        err = bytearray()
+        deadline = time.monotonic() + timeout
+        i = end = err_end = -1
+        # Marker searches resume near where the last one stopped, not from byte 0
+        out_from = err_from = 0
+        while True:
+            if i < 0:
+                i = out.find(out_mark, out_from)
+                out_from = max(0, len(out) - len(out_mark) + 1)
+            if i >= 0 and end < 0:
+                end = out.find(b'\n', i + len(out_mark))
+            if err_end < 0:
+                err_end = err.find(err_mark, err_from)
+                err_from = max(0, len(err) - len(err_mark) + 1)
+            if end >= 0 and err_end >= 0:
+                break
+            # An empty read means EOF; fall through to the exit check
+            if chan.recv_ready():
+                data = chan.recv(65536)
+                if data:
+                    out += data
+                    continue
+            if chan.recv_stderr_ready():
+                data = chan.recv_stderr(65536)
+                if data:
+                    err += data
+                    continue
+            if chan.closed or chan.exit_status_ready():
+                raise EOFError("Remote shell exited unexpectedly")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Command timed out after {timeout:g}s")
+            select.select([chan], [], [], min(remaining, 0.5))
+        try:
+            status = int(out[i + len(out_mark):end])
+        except ValueError:
+            status = -1
+        return out[:i], err[:err_end], status
+
+
+class SFTPPool:
+    """Hands out SFTP sessions for background work, separate from the browsing session.
+
+    Sessions are opened lazily with `opener`, at most `max_size` at a time, and returned
+    to the pool after use. Sessions whose channel has closed are discarded and reopened.
+    """
+
+    def __init__(self, opener: Callable[[], 'paramiko.SFTPClient'], max_size: int = 4):
+        self._opener = opener
+        self._slots = threading.Semaphore(max_size)
+        self._idle: List['paramiko.SFTPClient'] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @contextmanager
+    def borrow(self) -> Iterator['paramiko.SFTPClient']:
+        """Borrow an SFTP session for the duration of a `with` block."""
+        self._slots.acquire()
+        sftp = None
+        try:
+            with self._lock:
+                if self._closed:
+                    raise EOFError("SFTP pool is closed")
+                while self._idle and sftp is None:
+                    candidate = self._idle.pop()
+                    if candidate.get_channel().closed:
+                        continue
+                    sftp = candidate
+            if sftp is None:
+                sftp = self._opener()
+            yield sftp
+        except Exception:
+            # The session may be mid-request; don't hand it to the next borrower
+            if sftp is not None:
+                try:
+                    sftp.close()
+                except Exception:
+                    pass
+                sftp = None
+            raise
+        finally:
+            if sftp is not None:
+                with self._lock:
+                    if self._closed:
+                        try:
+                            sftp.close()
+                        except Exception:
+                            pass
+                    else:
+                        self._idle.append(sftp)
+            self._slots.release()
+
+    def close(self):
+        """Close idle sessions; sessions still borrowed are closed when returned."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for sftp in idle:
+            try:
+                sftp.close()
+            except Exception:
+                pass
 
 
 class SSHConnection:
-    """Handles SSH connections to remote servers."""
+    """Handles SSH connections to remote servers.
+
+    Disconnected clients are parked for `IDLE_TTL` seconds, keyed by their connect
+    arguments, so reconnecting to the same server skips the TCP/KEX/auth handshake.
+    A timer closes each parked client when its time is up.
+    """
+
+    IDLE_TTL = 300.0
+    # (host, port, username, password digest, compress) -> (client, expiry timer)
+    _idle: Dict[tuple, Tuple['paramiko.SSHClient', threading.Timer]] = {}
+    _idle_lock = threading.Lock()
 
     def __init__(self):
-        self.client: Optional[paramiko.SSHClient] = None
+        self.client: Optional['paramiko.SSHClient'] = None
+        self.executor: Optional[RemoteExecutor] = None
+        self._key: Optional[tuple] = None
+        # paramiko (and cryptography) is imported on first connect to keep startup fast
+        self._paramiko = None
+
+    def _load_paramiko(self):
+        if self._paramiko is None:
+            import paramiko
+            self._paramiko = paramiko
+        return self._paramiko
 
-    def connect(self, host: str, username: str, password: str, port: int = 22) -> Tuple[bool, str]:
-        """Connect to SSH server. Returns (success: bool, message: str)"""
+    def preload(self):
+        """Import paramiko ahead of the first connect; safe to call from a worker thread."""
         try:
+            self._load_paramiko()
+        except ImportError:
+            pass  # connect() reports it
+
+    def connect(self, host: str, username: str, password: str, port: int = 22,
+                keepalive_interval: int = 30, compress: bool = True) -> Tuple[bool, str]:
+        """Connect to SSH server. Returns (success: bool, message: str)
+
+        `keepalive_interval` is in seconds; 0 disables keepalive packets.
+        `compress` requests zlib compression for the whole transport, SFTP included.
+        """
+        try:
+            paramiko = self._load_paramiko()
+        except ImportError:
+            return False, "The 'paramiko' package is required for SSH connections. Install it with 'pip install paramiko'."
+        # Only a digest of the password is kept in the key of a parked client
+        digest = hashlib.sha256(password.encode('utf-8')).hexdigest()
+        key = (host, port, username, digest, compress)
+        client = self._take_idle(key)
+        if client is not None:
+            client.get_transport().set_keepalive(keepalive_interval)
+            self.client = client
+            self._key = key
+            self.executor = RemoteExecutor(client)
+            return True, f"Reconnected to {host}"
+        try:
+            # Open the TCP connection ourselves so Nagle is off before the key exchange:
+            # SFTP and the command shell exchange many small request packets
+            sock = socket.create_connection((host, port), timeout=10)
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                pass
             self.client = paramiko.SSHClient()
             self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
             self.client.connect(
@@ -18,8 +276,17 @@ class SSHConnection:
                 port=port,
                 username=username,
                 password=password,
-                timeout=10
+                timeout=10,
+                sock=sock,
+                # zlib costs a little CPU on both ends but shrinks command/log/SFTP traffic
+                compress=compress
             )
+            transport = self.client.get_transport()
+            if transport is not None:
+                # Keep idle sessions alive through NAT/firewall timeouts
+                transport.set_keepalive(keepalive_interval)
+            self.executor = RemoteExecutor(self.client)
+            self._key = key
             return True, f"Successfully connected to {host}"
         except paramiko.AuthenticationException:
             return False, "Authentication failed: Incorrect username or password."
@@ -29,13 +296,68 @@ class SSHConnection:
             return False, f"Connection failed: {str(e)}"
 
     def disconnect(self):
-        """Disconnect from SSH server."""
+        """Disconnect from SSH server, keeping a live client parked for quick reuse."""
+        if self.executor:
+            self.executor.close()
+            self.executor = None
         if self.client:
-            self.client.close()
+            if self._key is not None and self.is_connected():
+                self._park(self._key, self.client)
+            else:
+                self.client.close()
             self.client = None
+            self._key = None
+
+    @classmethod
+    def _take_idle(cls, key: tuple) -> Optional['paramiko.SSHClient']:
+        """Pop the parked client for `key` if its transport is still up."""
+        with cls._idle_lock:
+            entry = cls._idle.pop(key, None)
+        if entry is None:
+            return None
+        client, timer = entry
+        timer.cancel()
+        transport = client.get_transport()
+        if transport is None or not transport.is_active():
+            client.close()
+            return None
+        return client
+
+    @classmethod
+    def _park(cls, key: tuple, client: 'paramiko.SSHClient'):
+        timer = threading.Timer(cls.IDLE_TTL, cls._expire, args=(key, client))
+        timer.daemon = True
+        with cls._idle_lock:
+            # Replace any client already parked under key
+            old = cls._idle.pop(key, None)
+            cls._idle[key] = (client, timer)
+        timer.start()
+        if old is not None and old[0] is not client:
+            old[1].cancel()
+            old[0].close()
+
+    @classmethod
+    def _expire(cls, key: tuple, client: 'paramiko.SSHClient'):
+        """Timer callback: close `client` if it is still the one parked under `key`."""
+        with cls._idle_lock:
+            entry = cls._idle.get(key)
+            if entry is None or entry[0] is not client:
+                return
+            del cls._idle[key]
+        client.close()
+
+    @classmethod
+    def close_all(cls):
+        """Close every parked client (call on application exit)."""
+        with cls._idle_lock:
+            idle = list(cls._idle.values())
+            cls._idle.clear()
+        for client, timer in idle:
+            timer.cancel()
+            client.close()
 
     def is_connected(self) -> bool:
         """Check if currently connected."""
-        if self.client and self.client.get_transport():
-            return self.client.get_transport().is_active()
-        return False
+        client = self.client
+        transport = client.get_transport() if client else None
+        return transport is not None and transport.is_active()
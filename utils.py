@@ -1,7 +1,20 @@
 import os
 import sys
 import tkinter as tk
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+# Resource root: the PyInstaller bundle dir when frozen, else this file's directory
+_BASE_PATH = getattr(sys, '_MEIPASS', None) or os.path.abspath(os.path.dirname(__file__))
+# Attribute on each Tk root holding its icon cache: (max_size, path) -> decoded and
+# scaled icon. Images belong to the interpreter that created them, so each root has its own
+_ICON_CACHE_ATTR = '_ssm_icon_cache'
+
+
+def _winfo_ints(widget: tk.Misc, *options: str) -> List[int]:
+    """Read several integer `winfo` values for a widget in a single Tcl round-trip."""
+    path = widget._w
+    script = ' '.join(f'[winfo {opt} {{{path}}}]' for opt in options)
+    return [int(v) for v in widget.tk.splitlist(widget.tk.eval(f'list {script}'))]
 
 
 def center_window(win: tk.Toplevel | tk.Tk, relative_to: Optional[tk.Misc] = None):
@@ -11,6 +24,7 @@ def center_window(win: tk.Toplevel | tk.Tk, relative_to: Optional[tk.Misc] = Non
     - relative_to: the widget to center relative to (defaults to win.master or screen)
     """
     try:
+        # One flush on the window itself is enough to get its requested size
         win.update_idletasks()
         # Determine parent to center against
         parent = relative_to
@@ -20,33 +34,31 @@ def center_window(win: tk.Toplevel | tk.Tk, relative_to: Optional[tk.Misc] = Non
             except Exception:
                 parent = None
 
-        # Target window size
-        w = win.winfo_width()
-        h = win.winfo_height()
+        # Target window size and screen size
+        w, h, rw, rh, sw, sh = _winfo_ints(win, 'width', 'height', 'reqwidth', 'reqheight',
+                                           'screenwidth', 'screenheight')
         if w <= 1 or h <= 1:
-            w = win.winfo_reqwidth()
-            h = win.winfo_reqheight()
+            w, h = rw, rh
 
         if parent is not None:
-            try:
-                parent.update_idletasks()
-            except Exception:
-                pass
-            px = parent.winfo_rootx()
-            py = parent.winfo_rooty()
-            pw = parent.winfo_width() or parent.winfo_reqwidth()
-            ph = parent.winfo_height() or parent.winfo_reqheight()
+            parent_opts = ('width', 'height', 'reqwidth', 'reqheight', 'rootx', 'rooty')
+            pw, ph, prw, prh, px, py = _winfo_ints(parent, *parent_opts)
+            if pw <= 1:
+                # Parent not laid out yet; flush it once as a fallback
+                try:
+                    parent.update_idletasks()
+                except Exception:
+                    pass
+                pw, ph, prw, prh, px, py = _winfo_ints(parent, *parent_opts)
+            pw = pw or prw
+            ph = ph or prh
             x = px + max(0, (pw - w) // 2)
             y = py + max(0, (ph - h) // 2)
         else:
-            sw = win.winfo_screenwidth()
-            sh = win.winfo_screenheight()
             x = max(0, (sw - w) // 2)
             y = max(0, (sh - h) // 2)
 
         # Clamp to screen bounds
-        sw = win.winfo_screenwidth()
-        sh = win.winfo_screenheight()
         x = max(0, min(x, sw - w))
         y = max(0, min(y, sh - h))
         win.geometry(f"{w}x{h}+{x}+{y}")
@@ -60,11 +72,7 @@ def resource_path(*relative_parts: str) -> str:
 
     Example: resource_path('server_manager_icons', 'server.png')
     """
-    try:
-        base_path = getattr(sys, '_MEIPASS')  # type: ignore[attr-defined]
-    except Exception:
-        base_path = os.path.abspath(os.path.dirname(__file__))
-    return os.path.join(base_path, *relative_parts)
+    return os.path.join(_BASE_PATH, *relative_parts)
 
 
 def bring_window_to_front(win: tk.Tk | tk.Toplevel | tk.Misc):
@@ -116,21 +124,40 @@ def _clear_topmost_safely(win: tk.Misc):
         pass
 
 
-def load_icon(max_size: int, *relative_parts: str) -> Optional[tk.PhotoImage]:
+def load_icon(max_size: int, *relative_parts: str, master: Optional[tk.Misc] = None) -> Optional[tk.PhotoImage]:
     """Load a PNG icon via Tk PhotoImage and scale it down if larger than max_size.
 
     Args:
         max_size: Maximum width/height in pixels for the returned image.
         *relative_parts: Path parts relative to the application resources.
+        master: A widget of the Tk root the image is for; defaults to the default root.
 
     Returns:
         A PhotoImage instance or None if the file doesn't exist or fails to load.
+        Loaded images are cached per root and (max_size, path) and shared between callers.
     """
+    root = master._root() if master is not None else tk._default_root
+    path = resource_path(*relative_parts)
+    key = (max_size, path)
+    cache: Optional[Dict[Tuple[int, str], tk.PhotoImage]] = getattr(root, _ICON_CACHE_ATTR, None)
+    if cache is None:
+        cache = {}
+        if root is not None:
+            setattr(root, _ICON_CACHE_ATTR, cache)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    img = _load_icon_uncached(max_size, path, root)
+    if img is not None:
+        cache[key] = img
+    return img
+
+
+def _load_icon_uncached(max_size: int, path: str, master: Optional[tk.Misc] = None) -> Optional[tk.PhotoImage]:
     try:
-        path = resource_path(*relative_parts)
         if not os.path.exists(path):
             return None
-        img = tk.PhotoImage(file=path)
+        img = tk.PhotoImage(file=path, master=master)
         try:
             w = int(img.width())
             h = int(img.height())